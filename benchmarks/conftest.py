@@ -0,0 +1,120 @@
+"""
+Shared fixtures and options for the PyImageJ benchmark suite.
+
+The benchmarks use the ij_fixture of the top-level conftest.py, and require
+pytest-benchmark. Run them with:
+
+    bin/bench.sh [--benchmark-sizes=1KB,1MB,1GB] [pytest options...]
+
+Each benchmark records its throughput (MB/s) and the peak resident set size
+of the process so far in the extra_info of the pytest-benchmark results.
+Multi-GB sizes need a large enough Java heap; see imagej.init.
+"""
+import re
+import sys
+
+import numpy as np
+import pytest
+import scyjava as sj
+
+from imagej.images import _imglib2_types
+
+_units = {"B": 1, "KB": 1024, "MB": 1024**2, "GB": 1024**3}
+
+# ArrayImgs factory method for each NumPy dtype.
+_array_imgs_methods = {
+    "bool_": "booleans",
+    "int8": "bytes",
+    "uint8": "unsignedBytes",
+    "int16": "shorts",
+    "uint16": "unsignedShorts",
+    "int32": "ints",
+    "uint32": "unsignedInts",
+    "int64": "longs",
+    "uint64": "unsignedLongs",
+    "float32": "floats",
+    "float64": "doubles",
+}
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--benchmark-sizes",
+        action="store",
+        default="1KB,1MB,64MB",
+        help="comma-separated image sizes to benchmark (e.g. 1KB,1MB,2GB)",
+    )
+
+
+def pytest_generate_tests(metafunc):
+    if "dtype" in metafunc.fixturenames:
+        dtypes = sorted(set(_imglib2_types.values()))
+        metafunc.parametrize("dtype", dtypes)
+    if "nbytes" in metafunc.fixturenames:
+        sizes = metafunc.config.getoption("--benchmark-sizes").split(",")
+        metafunc.parametrize("nbytes", [_parse_size(s) for s in sizes], ids=sizes)
+    if "order" in metafunc.fixturenames:
+        metafunc.parametrize("order", ["C", "F"])
+
+
+@pytest.fixture
+def shape(dtype, nbytes):
+    """A 2D shape for an image of (approximately) nbytes of the given dtype."""
+    count = max(1, nbytes // np.dtype(dtype).itemsize)
+    width = max(1, int(np.sqrt(count)))
+    return (max(1, count // width), width)
+
+
+@pytest.fixture
+def narr(dtype, shape, order):
+    """A NumPy image of the given dtype, shape and memory order."""
+    return np.ones(shape, dtype=dtype, order=order)
+
+
+@pytest.fixture
+def java_img(ij_fixture, dtype, shape):
+    """A Java ArrayImg of the given dtype and shape (in NumPy order)."""
+    ArrayImgs = sj.jimport("net.imglib2.img.array.ArrayImgs")
+    return getattr(ArrayImgs, _array_imgs_methods[dtype])(*shape[::-1])
+
+
+@pytest.fixture
+def java_dataset(ij_fixture, java_img):
+    """A Java Dataset wrapping java_img."""
+    return ij_fixture.py.to_dataset(java_img)
+
+
+@pytest.fixture
+def measure(benchmark, nbytes):
+    """
+    Benchmark a function processing nbytes of image data,
+    recording its throughput and the peak RSS in the results.
+    """
+
+    def run(func, *args, **kwargs):
+        result = benchmark(func, *args, **kwargs)
+        benchmark.extra_info["MB/s"] = nbytes / benchmark.stats.stats.mean / 1024**2
+        peak_rss = _peak_rss()
+        if peak_rss is not None:
+            benchmark.extra_info["peak RSS (MB)"] = peak_rss / 1024**2
+        return result
+
+    return run
+
+
+def _parse_size(size: str) -> int:
+    match = re.fullmatch(r"\s*(\d+)\s*([KMG]?B)\s*", size.upper())
+    if not match:
+        raise ValueError(f"Invalid benchmark size: {size}")
+    return int(match.group(1)) * _units[match.group(2)]
+
+
+def _peak_rss():
+    try:
+        import resource
+    except ImportError:
+        # NB: The resource module is unavailable on Windows.
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # NB: ru_maxrss is in bytes on macOS, but in kilobytes elsewhere.
+    return peak if sys.platform == "darwin" else peak * 1024
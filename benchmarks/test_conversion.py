@@ -0,0 +1,48 @@
+"""
+Benchmarks of the Python <-> Java image conversion paths.
+"""
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+# -- Python -> Java --
+
+
+def test_to_java(ij_fixture, measure, narr):
+    measure(ij_fixture.py.to_java, narr)
+
+
+def test_to_dataset(ij_fixture, measure, narr):
+    measure(ij_fixture.py.to_dataset, narr)
+
+
+def test_to_img(ij_fixture, measure, narr):
+    measure(ij_fixture.py.to_img, narr)
+
+
+# -- Java -> Python --
+
+
+def test_from_java(ij_fixture, measure, java_img):
+    measure(ij_fixture.py.from_java, java_img)
+
+
+def test_from_java_dataset(ij_fixture, measure, java_dataset):
+    measure(ij_fixture.py.from_java, java_dataset)
+
+
+def test_rai_to_numpy(ij_fixture, measure, java_img):
+    narr = ij_fixture.py.initialize_numpy_image(java_img)
+    measure(ij_fixture.py.rai_to_numpy, java_img, narr)
+
+
+def test_to_xarray(ij_fixture, measure, java_dataset):
+    measure(ij_fixture.py.to_xarray, java_dataset)
+
+
+# -- RAIOperators --
+
+
+def test_slice_from_java(ij_fixture, measure, java_img):
+    # NB: Slicing alone yields a view; convert it to measure pixel access.
+    measure(lambda: ij_fixture.py.from_java(java_img[:, 1:-1]))
@@ -0,0 +1,6 @@
+#!/bin/sh
+
+dir=$(dirname "$0")
+cd "$dir/.."
+
+python -m pytest -p no:faulthandler benchmarks "$@"
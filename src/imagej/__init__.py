@@ -30,28 +30,39 @@ Here is an example of opening an image using ImageJ2 and displaying it:
     # Display the image (backed by matplotlib).
     ij.py.show(image, cmap="gray")
 """
-
+import argparse
 import logging
+import operator
 import os
 import re
 import subprocess
 import sys
 import threading
 import time
+from contextlib import contextmanager, nullcontext
 from enum import Enum
-from functools import lru_cache
+from functools import lru_cache, reduce
 from pathlib import Path
-from typing import Tuple, Union
+from typing import Optional, Tuple, Union
 
 import numpy as np
 import scyjava as sj
 import xarray as xr
-from jpype import JImplementationFor, setupGuiEnvironment
+from jpype import (
+    JArray,
+    JClass,
+    JException,
+    JImplementationFor,
+    JLong,
+    setupGuiEnvironment,
+)
 from scyjava.config import find_jars
 
+import imagej._classpath as _classpath
 import imagej.convert as convert
 import imagej.dims as dims
 import imagej.images as images
+import imagej.shm as shm
 import imagej.stack as stack
 from imagej._java import JObjectArray, jc
 from imagej._java import log_exception as _log_exception
@@ -181,17 +192,55 @@ class ImageJPython:
         """
         return images.dtype(image_or_type)
 
-    def from_java(self, data):
+    def from_java(self, data, threads: Optional[int] = 1, lazy: bool = False):
         """Convert supported Java data into Python equivalents.
 
         Converts Java objects (e.g. net.imagej.Dataset) into the Python
         equivalents.
 
         :param data: Java object to be converted into its respective Python counterpart.
+        :param threads: The number of threads to copy image data with,
+            or None for one thread per CPU core.
+        :param lazy: If True, convert images to dask arrays (wrapped in an
+            xarray DataArray for images with axes) whose chunks are copied
+            from Java on demand, without copying the whole image up front.
+            Requires dask to be installed.
         :return: A Python object converted from Java.
         """
+        if isinstance(data, ImgMathExpression):
+            data = data.compute()
+        if (threads != 1 or lazy) and sj.isjava(data):
+            image = self._image_from_java(data, threads=threads, lazy=lazy)
+            if image is not None:
+                return image
         return sj.to_python(data)
 
+    def startup_profile(self) -> list:
+        """Get the start-up profile of this gateway.
+
+        Reports where the time went during the imagej.init call which created
+        this gateway, phase by phase:
+
+        * endpoints - assembling the classpath (or reading it from the cache)
+        * start_jvm - resolving Maven endpoints via jgo, and starting the JVM
+        * gateway - creating the ImageJ2 gateway and its SciJava context
+
+        The JVM phases are absent when the JVM was already running. Two optional
+        phases follow once they have happened, i.e. on first use, each timed on
+        its own rather than since the previous phase:
+
+        * legacy - obtaining the LegacyService of the original ImageJ
+        * converters - registering PyImageJ's Python <-> Java converters
+
+        :return:
+            A list with one dict per phase, in order, holding the "phase" name,
+            its wall time in "seconds", and the bytes of JVM heap in use at the
+            end of the phase ("heap_used", None before the JVM started).
+            Empty if the gateway was not created via imagej.init.
+        """
+        profile = getattr(self._ij, "_startup_profile", None)
+        return [] if profile is None else [dict(phase) for phase in profile.phases]
+
     def initialize_numpy_image(self, image) -> np.ndarray:
         """Initialize a NumPy array with zeros and shape of the input image.
 
@@ -205,6 +254,48 @@ class ImageJPython:
         """
         return images.create_ndarray(image)
 
+    def iter_planes(
+        self,
+        image,
+        axis: Union[str, int] = "pln",
+        reuse_buffer: bool = False,
+        threads: Optional[int] = 1,
+    ):
+        """Iterate over a Java image one hyperslice at a time.
+
+        Yields the image's hyperslices along the given axis as NumPy arrays,
+        copying only one hyperslice from Java at a time. This allows images
+        too large for memory (e.g. cell-cached Datasets opened by SCIFIO)
+        to be processed plane by plane. As with ij.py.rai_to_numpy, each
+        array's dimensions are reversed relative to the Java image.
+
+        :param image: A Java image (e.g. Dataset, ImgPlus or
+            RandomAccessibleInterval).
+        :param axis: The axis to iterate along: either a dimension label in
+            Python or ImageJ convention (e.g. "pln", "Z", "t" or "Time") for
+            images with labeled axes, or an axis index in NumPy order.
+        :param reuse_buffer: If True, copy every hyperslice into the same
+            array, which is then overwritten on each iteration. This avoids
+            allocating a new array per hyperslice.
+        :param threads: The number of threads to copy each hyperslice with,
+            or None for one thread per CPU core.
+        :return: A generator of NumPy arrays, one per position along the axis.
+
+        :example:
+
+        .. highlight:: python
+        .. code-block:: python
+
+            dataset = ij.io().open("huge-timelapse.ome.tif")
+            means = [plane.mean() for plane in ij.py.iter_planes(dataset, "t")]
+        """
+        if jc.ImagePlus and isinstance(image, jc.ImagePlus):
+            image = convert.imageplus_to_imgplus(self._ij, image)
+        if not isinstance(image, jc.RandomAccessibleInterval):
+            image = self._ij.convert().convert(image, jc.RandomAccessibleInterval)
+        d = dims._get_dimension_index(image, axis)
+        return stack.iter_hyperslices(self._ij, image, d, reuse_buffer, threads)
+
     def jargs(self, *args):
         """Convert Python arguments into a Java Object[]
 
@@ -219,7 +310,10 @@ class ImageJPython:
         return JObjectArray()([self.to_java(arg) for arg in args])
 
     def rai_to_numpy(
-        self, rai: "jc.RandomAccessibleInterval", numpy_array: np.ndarray
+        self,
+        rai: "jc.RandomAccessibleInterval",
+        numpy_array: np.ndarray,
+        threads: Optional[int] = 1,
     ) -> np.ndarray:
         """Copy a RandomAccessibleInterval into a numpy array.
 
@@ -232,9 +326,11 @@ class ImageJPython:
         :param rai: A net.imglib2.RandomAccessibleInterval.
         :param numpy_array: A NumPy array with the same shape as the input
             RandomAccessibleInterval.
+        :param threads: The number of threads to copy with, splitting the image
+            along its slowest axis, or None for one thread per CPU core.
         :return: NumPy array with the input RandomAccessibleInterval data.
         """
-        images.copy_rai_into_ndarray(self._ij, rai, numpy_array)
+        images.copy_rai_into_ndarray(self._ij, rai, numpy_array, threads=threads)
         return numpy_array
 
     def run_macro(self, macro: str, args=None):
@@ -489,7 +585,8 @@ class ImageJPython:
         """Convert supported Python data into Java equivalents.
 
         Converts Python objects (e.g. xarray.DataArray) into the Java
-        equivalents. For numpy arrays, the Java image points to the Python array.
+        equivalents. For numpy arrays, the Java image points to the Python array;
+        likewise, for SharedArrays (see imagej.shm), to their shared memory.
 
         :param data: Python object to be converted into its respective Java counterpart.
         :param hints: Optional conversion hints.
@@ -595,30 +692,51 @@ class ImageJPython:
 
     def _add_converters(self):
         """Add all known converters to ScyJava's conversion mechanism."""
+        # NB: Rather than adding each converter to scyjava, which would evaluate
+        # all of their predicates for every conversion, add one dispatcher per
+        # priority, which memoizes the winning converter for each type. Only
+        # the ConvertService-based predicates are evaluated for every object,
+        # since its answer may depend on the object rather than its class.
+        java_converters = convert._ConverterGroups()
+        py_converters = convert._ConverterGroups()
 
         # Python to Java
-        sj.add_java_converter(
+        java_converters.add(
             sj.Converter(
                 predicate=images.is_xarraylike,
                 converter=lambda obj, **hints: self.to_dataset(obj),
                 priority=sj.Priority.HIGH + 1,
             )
         )
-        sj.add_java_converter(
+        java_converters.add(
             sj.Converter(
                 predicate=convert.supports_ctype_to_realtype,
                 converter=convert.ctype_to_realtype,
                 priority=sj.Priority.HIGH + 1,
             )
         )
-        sj.add_java_converter(
+        java_converters.add(
             sj.Converter(
                 predicate=convert.supports_labeling_to_imglabeling,
                 converter=lambda obj: convert.labeling_to_imglabeling(self._ij, obj),
                 priority=sj.Priority.HIGH + 1,
             )
         )
-        sj.add_java_converter(
+        java_converters.add(
+            sj.Converter(
+                predicate=lambda obj: isinstance(obj, ImgMathExpression),
+                converter=lambda obj: obj.compute(),
+                priority=sj.Priority.HIGH + 1,
+            )
+        )
+        java_converters.add(
+            sj.Converter(
+                predicate=lambda obj: isinstance(obj, shm.SharedArray),
+                converter=lambda obj, **hints: self.to_img(obj.array),
+                priority=sj.Priority.HIGH,
+            )
+        )
+        java_converters.add(
             sj.Converter(
                 predicate=images.is_memoryarraylike,
                 converter=lambda obj, **hints: self.to_img(obj),
@@ -627,7 +745,7 @@ class ImageJPython:
         )
 
         # Java to Python
-        sj.add_py_converter(
+        py_converters.add(
             sj.Converter(
                 predicate=lambda obj: jc.ImagePlus and isinstance(obj, jc.ImagePlus),
                 converter=lambda obj: self.from_java(
@@ -636,42 +754,46 @@ class ImageJPython:
                 priority=sj.Priority.HIGH + 2,
             )
         )
-        sj.add_py_converter(
+        py_converters.add(
             sj.Converter(
                 predicate=convert.supports_realtype_to_ctype,
                 converter=convert.realtype_to_ctype,
                 priority=sj.Priority.HIGH + 1,
             )
         )
-        sj.add_py_converter(
+        py_converters.add(
             sj.Converter(
                 predicate=lambda obj: convert.supports_java_to_xarray(self._ij, obj),
                 converter=lambda obj: convert.java_to_xarray(self._ij, obj),
                 priority=sj.Priority.HIGH,
-            )
+            ),
+            by_type=False,
+            type_check=convert.is_image_class,
         )
-        sj.add_py_converter(
+        py_converters.add(
             sj.Converter(
                 predicate=convert.supports_imglabeling_to_labeling,
                 converter=lambda obj: convert.imglabeling_to_labeling(self._ij, obj),
                 priority=sj.Priority.HIGH,
             )
         )
-        sj.add_py_converter(
+        py_converters.add(
             sj.Converter(
                 predicate=lambda obj: convert.supports_java_to_ndarray(self._ij, obj),
                 converter=lambda obj: convert.java_to_ndarray(self._ij, obj),
                 priority=sj.Priority.HIGH - 2,
-            )
+            ),
+            by_type=False,
+            type_check=convert.is_image_class,
         )
-        sj.add_py_converter(
+        py_converters.add(
             sj.Converter(
                 predicate=lambda obj: isinstance(obj, jc.ImageMetadata),
                 converter=lambda obj: convert.image_metadata_to_dict(self._ij, obj),
                 priority=sj.Priority.HIGH - 2,
             )
         )
-        sj.add_py_converter(
+        py_converters.add(
             sj.Converter(
                 predicate=lambda obj: isinstance(obj, jc.MetadataWrapper),
                 converter=lambda obj: convert.metadata_wrapper_to_dict(self._ij, obj),
@@ -680,7 +802,7 @@ class ImageJPython:
         )
         # add the ij.measure.ResultsTable converter only if legacy is enabled
         if self._ij.legacy and self._ij.legacy.isActive():
-            sj.add_py_converter(
+            py_converters.add(
                 sj.Converter(
                     predicate=lambda obj: isinstance(obj, jc.ResultsTable),
                     converter=lambda obj: self.from_java(
@@ -690,6 +812,32 @@ class ImageJPython:
                 )
             )
 
+        java_converters.register(sj.add_java_converter)
+        py_converters.register(sj.add_py_converter)
+        self._java_converters = java_converters
+        self._py_converters = py_converters
+
+    def _image_from_java(self, data, **kwargs):
+        """
+        Convert a Java image into a NumPy ndarray or xarray DataArray, passing
+        the given keyword arguments to the conversion function. This mirrors
+        the image converters registered by _add_converters, for callers which
+        need to customize the conversion.
+
+        :return: The converted image, or None if data is not a Java image.
+        """
+        if convert.supports_realtype_to_ctype(data):
+            return None
+        if jc.ImagePlus and isinstance(data, jc.ImagePlus):
+            data = convert.imageplus_to_imgplus(self._ij, data)
+        if convert.supports_java_to_xarray(self._ij, data):
+            return convert.java_to_xarray(self._ij, data, **kwargs)
+        if convert.supports_imglabeling_to_labeling(data):
+            return None
+        if convert.supports_java_to_ndarray(self._ij, data):
+            return convert.java_to_ndarray(self._ij, data, **kwargs)
+        return None
+
     def _format_argument(self, key, value, ij1_style):
         if value is True:
             argument = str(key)
@@ -752,7 +900,8 @@ class GatewayAddons(object):
 
         :return: ImageJPython convenience methods.
         """
-        return ImageJPython(self)
+        with _startup_phase(self, "converters"):
+            return ImageJPython(self)
 
     @property
     def legacy(self):
@@ -764,18 +913,19 @@ class GatewayAddons(object):
         :return: The ImageJ2 LegacyService.
         """
         if not hasattr(self, "_legacy"):
-            try:
-                # NB This call is necessary for loading the LegacyService
-                sj.jimport("net.imagej.legacy.LegacyService")
-
-                self._legacy = self.get("net.imagej.legacy.LegacyService")
-                if self.ui().isHeadless():
-                    _logger.warning(
-                        "Operating in headless mode - the original ImageJ "
-                        "will have limited functionality."
-                    )
-            except TypeError:
-                self._legacy = None
+            with _startup_phase(self, "legacy"):
+                try:
+                    # NB This call is necessary for loading the LegacyService
+                    sj.jimport("net.imagej.legacy.LegacyService")
+
+                    self._legacy = self.get("net.imagej.legacy.LegacyService")
+                    if self.ui().isHeadless():
+                        _logger.warning(
+                            "Operating in headless mode - the original ImageJ "
+                            "will have limited functionality."
+                        )
+                except (JException, TypeError):
+                    self._legacy = None
 
         return self._legacy
 
@@ -858,6 +1008,121 @@ class IntervalAddons(object):
         return tuple(self.dimension(d) for d in range(self.numDimensions()))
 
 
+# The most pixels per requested pixel that RandomAccessibleInterval.take and put
+# copy in bulk, rather than accessing the requested pixels one at a time.
+_BLOCK_COPY_RATIO = 256
+
+# The number of hyperplanes combined per pass of RandomAccessibleInterval reductions.
+_FOLD = 256
+
+
+class ImgMathExpression:
+    """A lazy arithmetic expression over RandomAccessibleIntervals.
+
+    The arithmetic operators of these expressions build an ImgLib2 ImgMath
+    function rather than an image, so that e.g. (a.lazy() + b) * c - d is
+    computed in a single pass into a single output image, without the
+    intermediate images of (a + b) * c - d. Operands may be images,
+    expressions or scalars. Start an expression with rai.lazy().
+
+    The expression is computed once, via compute, or when it is converted
+    via ij.py.to_java or ij.py.from_java. It is not a Java object itself, so
+    compute it before passing it to other functions.
+
+    :param function: The ImgMath function of the expression.
+    :param template: The image whose dimensions and type the output takes.
+    """
+
+    def __init__(self, function, template):
+        self.function = function
+        self.template = template
+        self._result = None
+
+    @classmethod
+    def of(cls, operation, template, *operands) -> "ImgMathExpression":
+        """
+        Create an expression applying an ImgMath operation to the operands.
+
+        :param operation: The ImgMath operation (e.g. jc.ImgMath.add).
+        :param template: The image whose dimensions and type the output takes.
+        :param operands: The images, expressions or scalars to operate on.
+        :return: The new expression.
+        """
+        args = [
+            o.function if isinstance(o, ImgMathExpression) else sj.to_java(o)
+            for o in operands
+        ]
+        return cls(operation(JObjectArray()(args)), template)
+
+    def compute(self, target: "jc.RandomAccessibleInterval" = None):
+        """Compute the expression, using multiple threads where supported.
+
+        :param target: The image to write the result into, or None to write it
+            into a new image, created like the template (and reused for any
+            later access to the result).
+        :return: The image holding the result.
+        """
+        if target is not None:
+            return _compute_into(self.function, target)
+        if self._result is None:
+            self._result = _compute_into(self.function, _blank_like(self.template))
+        return self._result
+
+    @property
+    def shape(self):
+        return self.template.shape
+
+    @property
+    def ndim(self):
+        return self.template.ndim
+
+    def __add__(self, other):
+        return ImgMathExpression.of(jc.ImgMath.add, self.template, self, other)
+
+    def __radd__(self, other):
+        return ImgMathExpression.of(jc.ImgMath.add, self.template, other, self)
+
+    def __sub__(self, other):
+        return ImgMathExpression.of(jc.ImgMath.sub, self.template, self, other)
+
+    def __rsub__(self, other):
+        return ImgMathExpression.of(jc.ImgMath.sub, self.template, other, self)
+
+    def __mul__(self, other):
+        return ImgMathExpression.of(jc.ImgMath.mul, self.template, self, other)
+
+    def __rmul__(self, other):
+        return ImgMathExpression.of(jc.ImgMath.mul, self.template, other, self)
+
+    def __truediv__(self, other):
+        return ImgMathExpression.of(jc.ImgMath.div, self.template, self, other)
+
+    def __rtruediv__(self, other):
+        return ImgMathExpression.of(jc.ImgMath.div, self.template, other, self)
+
+
+def _compute_into(function, target: "jc.RandomAccessibleInterval"):
+    compute = jc.ImgMath.compute(function)
+    # NB: Multithreaded computation needs a recent ImgLib2 Algorithm.
+    into = getattr(compute, "parallelInto", None) or compute.into
+    into(target)
+    return target
+
+
+def _blank_like(image: "jc.RandomAccessibleInterval"):
+    if isinstance(image, jc.Dataset):
+        return image.duplicateBlank()
+    if isinstance(image, jc.ImgPlus):
+        # NB: Keep the name, axes and calibration of the image.
+        return jc.ImgPlus(image.factory().create(image), image)
+    if isinstance(image, jc.Img):
+        return image.factory().create(image)
+    t = jc.Util.getTypeFromInterval(image).createVariable()
+    out = jc.Util.getArrayOrCellImgFactory(image, t).create(image)
+    # NB: Views may not start at the origin; align the output with them.
+    return jc.Views.translate(out, JArray(JLong)(list(image.minAsLongArray())))
+
+
 @JImplementationFor("net.imglib2.RandomAccessibleInterval")
 class RAIOperators(object):
     """RandomAccessibleInterval operators.
@@ -869,42 +1134,79 @@ class RAIOperators(object):
     https://jpype.readthedocs.io/en/latest/userguide.html#class-customizers
     """
 
-    def _compute(self, other, ifunc):
-        return jc.ImgMath.computeInto(ifunc(self._jargs(self, other)), self.copy())
-
     def __add__(self, other):
         """Return self + value."""
-        return (
-            self._op.run("math.add", self, other)
-            if self._op is not None
-            else self._compute(other, jc.ImgMath.add)
-        )
+        return self._compute(jc.ImgMath.add, self, other)
+
+    def __radd__(self, other):
+        """Return value + self."""
+        return self._compute(jc.ImgMath.add, other, self)
 
     def __sub__(self, other):
         """Return self - value."""
-        return (
-            self._op.run("math.sub", self, other)
-            if self._op is not None
-            else self._compute(other, jc.ImgMath.sub)
-        )
+        return self._compute(jc.ImgMath.sub, self, other)
+
+    def __rsub__(self, other):
+        """Return value - self."""
+        return self._compute(jc.ImgMath.sub, other, self)
 
     def __mul__(self, other):
         """Return self * value."""
-        return (
-            self._op.run("math.mul", self, other)
-            if self._op is not None
-            else self._compute(other, jc.ImgMath.mul)
-        )
+        return self._compute(jc.ImgMath.mul, self, other)
+
+    def __rmul__(self, other):
+        """Return value * self."""
+        return self._compute(jc.ImgMath.mul, other, self)
 
     def __truediv__(self, other):
         """Return self / value."""
-        return (
-            self._op.run("math.div", self, other)
-            if self._op is not None
-            else self._compute(other, jc.ImgMath.div)
-        )
+        return self._compute(jc.ImgMath.div, self, other)
+
+    def __rtruediv__(self, other):
+        """Return value / self."""
+        return self._compute(jc.ImgMath.div, other, self)
+
+    def lazy(self) -> ImgMathExpression:
+        """Start a lazy arithmetic expression with this image.
+
+        Arithmetic on the returned expression is computed only once, in a
+        single pass, rather than one image per operator; see ImgMathExpression.
+
+        :return: The expression, to be computed via its compute method.
+        """
+        return ImgMathExpression(jc.ImgMath.img(self), self)
+
+    def __iadd__(self, other):
+        """Add value to self in place, using multiple threads."""
+        return self._compute_in_place(jc.ImgMath.add, other)
+
+    def __isub__(self, other):
+        """Subtract value from self in place, using multiple threads."""
+        return self._compute_in_place(jc.ImgMath.sub, other)
+
+    def __imul__(self, other):
+        """Multiply self by value in place, using multiple threads."""
+        return self._compute_in_place(jc.ImgMath.mul, other)
+
+    def __itruediv__(self, other):
+        """Divide self by value in place, using multiple threads."""
+        return self._compute_in_place(jc.ImgMath.div, other)
+
+    def _compute(self, operation, *operands):
+        expression = ImgMathExpression.of(operation, self, *operands)
+        if any(isinstance(o, ImgMathExpression) for o in operands):
+            # NB: Arithmetic with a lazy expression stays lazy.
+            return expression
+        return expression.compute()
+
+    def _compute_in_place(self, operation, other):
+        # NB: Each pixel is read before it is written, so no copy is needed.
+        ImgMathExpression.of(operation, self, self, other).compute(self)
+        return self
 
     def __getitem__(self, key):
+        if self._is_fancy_index(key):
+            return self._fancy_index(key)
         if isinstance(key, slice):
             # Wrap single slice into tuple of length 1.
             return self._slice((key,))
@@ -925,6 +1227,201 @@ class RAIOperators(object):
         """
         return type(jc.Util.getTypeFromInterval(self))
 
+    def take(self, coords) -> np.ndarray:
+        """Read the values of many pixels at once.
+
+        Images whose storage is shared with Python (e.g. images wrapping a
+        NumPy ndarray, or backed by direct buffers) are read with a NumPy
+        gather. Otherwise, the bounding box of the pixels is copied with a
+        single bulk copy and gathered from, unless it holds many more pixels
+        than requested, in which case the pixels are read one at a time.
+
+        :param coords: An (N, ndim) array of pixel positions, in the dimension
+            order of rai[...] indexing. Negative positions count from the end.
+        :return: A NumPy ndarray of the N pixel values, of the image's dtype.
+        """
+        coords = self._positions(coords)
+        narr = images.ndarray_from_storage(self, copy=False)
+        if narr is not None:
+            # NB: The ndarray has reversed dimensions relative to the image.
+            return narr[tuple(coords[:, ::-1].T)]
+        block = self._block(coords)
+        if block is not None:
+            view, narr, offset = block
+            return narr[tuple((coords - offset)[:, ::-1].T)]
+
+        dtype = images.dtype(self)
+        values = np.empty(len(coords), dtype=images._pixel_dtype(dtype))
+        ra = self.randomAccess()
+        get = images._pixel_getter(dtype)
+        for i, position in enumerate(coords):
+            ra.setPosition(JArray(JLong)(position))
+            values[i] = get(ra.get())
+        return values.astype(dtype, copy=False)
+
+    def put(self, coords, values) -> None:
+        """Write the values of many pixels at once.
+
+        Images whose storage is shared with Python (e.g. images wrapping a
+        NumPy ndarray, or backed by direct buffers) are written with a NumPy
+        scatter. Otherwise, the bounding box of the pixels is copied out,
+        scattered into and copied back, with one bulk copy each way, unless
+        it holds many more pixels than requested, in which case the pixels
+        are written one at a time.
+
+        :param coords: An (N, ndim) array of pixel positions, in the dimension
+            order of rai[...] indexing. Negative positions count from the end.
+        :param values: The N values to write, or a single value to write to
+            all N pixels.
+        """
+        coords = self._positions(coords)
+        narr = images.ndarray_from_storage(self, copy=False)
+        if narr is not None:
+            narr[tuple(coords[:, ::-1].T)] = values
+            return
+        block = self._block(coords)
+        if block is not None:
+            view, narr, offset = block
+            narr[tuple((coords - offset)[:, ::-1].T)] = values
+            jc.ImgUtil.copy(sj.to_java(narr), view)
+            return
+
+        dtype = images.dtype(self)
+        values = np.broadcast_to(np.asarray(values, dtype=dtype), (len(coords),))
+        values = values.astype(images._pixel_dtype(dtype), copy=False)
+        ra = self.randomAccess()
+        set_value = images._pixel_setter(dtype)
+        for position, value in zip(coords, values.tolist()):
+            ra.setPosition(JArray(JLong)(position))
+            set_value(ra.get(), value)
+
+    def sum(self, axis=None, dtype=None, out=None, keepdims=False):
+        """Sum of the pixel values, computed on the Java side.
+
+        Only the (small) result is transferred to Python; see amin for
+        details. The sum is computed in double precision.
+
+        :param axis: The axis or axes to sum over, in the dimension order of
+            rai[...] indexing, or None to sum over all axes.
+        :param dtype: The dtype of the result, or None for float64.
+        :param out: An ndarray to write the result into, or None.
+        :param keepdims: Whether to keep the summed axes, with length one.
+        :return: The sum, as a NumPy ndarray (or scalar, for all axes).
+        """
+        return self._reduction(jc.ImgMath.add, axis, dtype, out, keepdims)
+
+    def mean(self, axis=None, dtype=None, out=None, keepdims=False):
+        """Mean of the pixel values, computed on the Java side.
+
+        :param axis: The axis or axes to average over, or None for all axes.
+        :param dtype: The dtype of the result, or None for float64.
+        :param out: An ndarray to write the result into, or None.
+        :param keepdims: Whether to keep the averaged axes, with length one.
+        :return: The mean, as a NumPy ndarray (or scalar, for all axes).
+        """
+        count = self._count(axis)
+        mean = self._reduction(jc.ImgMath.add, axis, None, None, keepdims) / count
+        return self._reduction_result(mean, dtype, out)
+
+    def std(self, axis=None, dtype=None, out=None, ddof=0, keepdims=False):
+        """Standard deviation of the pixel values, computed on the Java side.
+
+        The values are shifted by (an approximation of) their mean first, so
+        that images with a large mean but a small variance lose no precision.
+
+        :param axis: The axis or axes to compute the standard deviation over,
+            or None for all axes.
+        :param dtype: The dtype of the result, or None for float64.
+        :param out: An ndarray to write the result into, or None.
+        :param ddof: The delta degrees of freedom, as for np.std.
+        :param keepdims: Whether to keep the reduced axes, with length one.
+        :return: The standard deviation, as a NumPy ndarray (or scalar).
+        """
+        count = self._count(axis)
+        # NB: Shift by a value of the image's type, with which to pad it too.
+        shift = jc.Util.getTypeFromInterval(self).createVariable()
+        shift.setReal(float(self.mean()))
+        total = self._reduction(jc.ImgMath.add, axis, None, None, keepdims, shift=shift)
+        squares = self._reduction(
+            jc.ImgMath.add, axis, None, None, keepdims, shift=shift, squared=True
+        )
+        variance = np.maximum(squares / count - (total / count) ** 2, 0)
+        std = np.sqrt(variance * count / (count - ddof))
+        return self._reduction_result(std, dtype, out)
+
+    def amin(self, axis=None, out=None, keepdims=False):
+        """Minimum of the pixel values, computed on the Java side.
+
+        The image is reduced by ImgMath functions computed in parallel, each
+        combining many hyperplanes of the image into one, so that only the
+        result is transferred to Python. (Unlike NumPy's, this method is not
+        named min, since RandomAccessibleIntervals have a Java min method.)
+
+        :param axis: The axis or axes to reduce, in the dimension order of
+            rai[...] indexing, or None to reduce all axes.
+        :param out: An ndarray to write the result into, or None.
+        :param keepdims: Whether to keep the reduced axes, with length one.
+        :return: The minimum, of the image's dtype where it has one.
+        """
+        return self._reduction(jc.ImgMath.min, axis, self._dtype, out, keepdims)
+
+    def amax(self, axis=None, out=None, keepdims=False):
+        """Maximum of the pixel values, computed on the Java side.
+
+        See amin for details.
+
+        :param axis: The axis or axes to reduce, or None to reduce all axes.
+        :param out: An ndarray to write the result into, or None.
+        :param keepdims: Whether to keep the reduced axes, with length one.
+        :return: The maximum, of the image's dtype where it has one.
+        """
+        return self._reduction(jc.ImgMath.max, axis, self._dtype, out, keepdims)
+
+    def histogram(
+        self, bins: int = 10, range=None, threads: Optional[int] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Histogram of the pixel values, computed on the Java side.
+
+        The image is split into slabs along its slowest dimension, whose
+        histograms are computed concurrently, and then added up.
+
+        :param bins: The number of equal-width bins.
+        :param range: The (lower, upper) range of the bins, or None for the
+            range of the pixel values. Values outside of it are ignored.
+        :param threads: The number of threads to compute the histogram with,
+            or None for one thread per CPU core.
+        :return: The counts of the bins and their edges, as for np.histogram.
+        """
+        if range is None:
+            # NB: Find the minimum and maximum in a single (parallel) pass.
+            t = jc.Util.getTypeFromInterval(self)
+            lower, upper = t.createVariable(), t.createVariable()
+            jc.ComputeMinMax(jc.Views.iterable(self), lower, upper).process()
+            range = (lower.getRealDouble(), upper.getRealDouble())
+        lower, upper = float(range[0]), float(range[1])
+        if lower == upper:
+            lower, upper = lower - 0.5, upper + 0.5
+        mapper = jc.Real1dBinMapper(lower, upper, JLong(bins), False)
+
+        def count(rai):
+            histogram = jc.Histogram1d(jc.Views.iterable(rai), mapper)
+            return np.array(histogram.toLongArray(), dtype=np.int64)
+
+        if threads is None:
+            threads = os.cpu_count() or 1
+        ndim = self.numDimensions()
+        slab_count = min(threads, self.dimension(ndim - 1)) if ndim > 0 else 1
+        if slab_count <= 1:
+            counts = count(self)
+        else:
+            executor = images._copy_executor(slab_count)
+            futures = [
+                executor.submit(count, slab)
+                for slab, _, _ in images._slabs(self, slab_count)
+            ]
+            counts = sum(future.result() for future in futures)
+        return counts, np.linspace(lower, upper, bins + 1)
+
     def squeeze(self, axis=None):
         """Remove axes of length one from array.
 
@@ -968,17 +1465,177 @@ class RAIOperators(object):
                 view = jc.Views.permute(view, i, max_dim - i)
         return view
 
+    def _fancy_index(self, key) -> np.ndarray:
+        # NB: Let NumPy apply the key to a (virtual) grid of the coordinates of
+        # each dimension, then gather the selected pixels all at once.
+        shape = self._shape
+        coords = []
+        for d in range(len(shape)):
+            axis_shape = [1] * len(shape)
+            axis_shape[d] = shape[d]
+            grid = np.broadcast_to(np.arange(shape[d]).reshape(axis_shape), shape)
+            coords.append(grid[key])
+        result_shape = coords[0].shape
+        positions = np.stack([c.ravel() for c in coords], axis=1)
+        return self.take(positions).reshape(result_shape)
+
     def _index(self, position):
         ra = self._ra
-        # Can we store this as a shape property?
-        if stack._index_within_range(position, self.shape):
+        shape = self._shape
+        if stack._index_within_range(position, shape):
             for i in range(len(position)):
                 pos = position[i]
                 if pos < 0:
-                    pos += self.shape[i]
+                    pos += shape[i]
                 ra.setPosition(pos, i)
             return ra.get()
 
+    def _is_fancy_index(self, key):
+        # Boolean masks and integer arrays, as opposed to ints and slices.
+        keys = key if isinstance(key, tuple) else (key,)
+        return any(isinstance(k, (list, np.ndarray)) for k in keys)
+
+    def _positions(self, coords) -> np.ndarray:
+        coords = np.asarray(coords, dtype=np.int64)
+        ndim = self.numDimensions()
+        if coords.ndim != 2 or coords.shape[1] != ndim:
+            raise ValueError(
+                f"Expected an (N, {ndim}) array of positions, not {coords.shape}"
+            )
+        shape = np.asarray(self._shape, dtype=np.int64)
+        coords = np.where(coords < 0, coords + shape, coords)
+        if np.any((coords < 0) | (coords >= shape)):
+            raise IndexError("Pixel position out of bounds")
+        return coords
+
+    def _block(self, coords):
+        # NB: Copying a pixel in bulk is far cheaper than the several bridge
+        # crossings of reading it alone, but not if the block is mostly unused.
+        offset, last = coords.min(axis=0), coords.max(axis=0)
+        # NB: Multiply Python ints, since the block size may overflow int64.
+        size = reduce(operator.mul, (last - offset + 1).tolist(), 1)
+        if size > _BLOCK_COPY_RATIO * len(coords):
+            return None
+        if images.copy_strategy() != "ImgUtil.copy":
+            return None
+        dtype = images.dtype(self)
+        if dtype.kind not in "iuf":
+            return None
+        view = jc.Views.zeroMin(
+            jc.Views.interval(self, JArray(JLong)(offset), JArray(JLong)(last))
+        )
+        narr = np.empty(tuple(reversed(last - offset + 1)), dtype=dtype)
+        jc.ImgUtil.copy(view, sj.to_java(narr))
+        return view, narr, offset
+
+    def _axes(self, axis) -> Tuple[int, ...]:
+        ndim = self.numDimensions()
+        if axis is None:
+            return tuple(range(ndim))
+        axes = (axis,) if isinstance(axis, int) else tuple(axis)
+        if any(not -ndim <= a < ndim for a in axes):
+            raise ValueError(f"Axis out of bounds for {ndim} dimensions: {axis}")
+        return tuple(sorted({a % ndim for a in axes}))
+
+    def _count(self, axis) -> int:
+        shape = self._shape
+        return int(np.prod([shape[d] for d in self._axes(axis)]))
+
+    @property
+    def _dtype(self):
+        try:
+            return images.dtype(self)
+        except TypeError:
+            return None
+
+    def _reduction(
+        self, operation, axis, dtype, out, keepdims, shift=None, squared=False
+    ):
+        # NB: Each pass combines (up to) _FOLD hyperplanes along one of the
+        # axes into one, computing an ImgMath function in parallel, until the
+        # axes have length one. Only the final result is copied into Python.
+        # Sums may subtract a shift (of the image's type) from each pixel, and
+        # square the result, in the first pass.
+        axes = self._axes(axis)
+        dims = list(self._shape)
+        summing = operation is jc.ImgMath.add
+        image = jc.Views.zeroMin(self)
+
+        def extend_with_shift(rai):
+            return jc.Views.extendValue(rai, shift)
+
+        first = True
+        for d in axes or (None,):
+            while first or dims[d] > 1:
+                # NB: Pad the last fold with values contributing nothing.
+                if not summing:
+                    extend = jc.Views.extendBorder
+                elif first and shift is not None:
+                    extend = extend_with_shift
+                else:
+                    extend = jc.Views.extendZero
+                operands = self._fold_operands(image, dims, d, extend)
+                if first and shift is not None:
+                    value = shift.getRealDouble()
+                    operands = [
+                        jc.ImgMath.sub(JObjectArray()([o, value])) for o in operands
+                    ]
+                if first and squared:
+                    operands = [
+                        jc.ImgMath.mul(JObjectArray()([o, o])) for o in operands
+                    ]
+                if len(operands) == 1:
+                    # NB: ImgMath operations need two operands.
+                    operands.append(0 if summing else operands[0])
+                if d is not None:
+                    dims[d] = -(-dims[d] // _FOLD)
+                interval = jc.FinalInterval(JArray(JLong)(dims))
+                factory = jc.Util.getArrayOrCellImgFactory(interval, jc.DoubleType())
+                image = _compute_into(
+                    operation(JObjectArray()(operands)), factory.create(interval)
+                )
+                first = False
+                if d is None:
+                    break
+
+        # NB: The result has reversed dimensions relative to the image.
+        narr = images.ndarray_from_storage(image)
+        if narr is None:
+            raise ValueError("Result of the reduction is too large")
+        narr = narr.T
+        if not keepdims:
+            narr = narr.reshape([n for d, n in enumerate(narr.shape) if d not in axes])
+        return self._reduction_result(narr, dtype, out)
+
+    @staticmethod
+    def _fold_operands(image, dims, d, extend):
+        if d is None:
+            return [image]
+        extended = extend(image)
+        fold = min(_FOLD, dims[d])
+        length = -(-dims[d] // fold)
+        operands = []
+        for i in range(fold):
+            min_ = [0] * len(dims)
+            max_ = [n - 1 for n in dims]
+            min_[d] = i
+            max_[d] = i + (length - 1) * fold
+            steps = [1] * len(dims)
+            steps[d] = fold
+            view = jc.Views.interval(extended, JArray(JLong)(min_), JArray(JLong)(max_))
+            view = jc.Views.subsample(jc.Views.zeroMin(view), JArray(JLong)(steps))
+            operands.append(view)
+        return operands
+
+    @staticmethod
+    def _reduction_result(narr: np.ndarray, dtype, out):
+        if dtype is not None:
+            narr = narr.astype(dtype)
+        if out is not None:
+            out[...] = narr
+            return out
+        return narr[()]
+
     def _is_index(self, a):
         # Check dimensionality - if we don't have enough dims, it's a slice
         num_dims = 1 if isinstance(a, int) else len(a)
@@ -991,9 +1648,6 @@ class RAIOperators(object):
         hasSlice = True in [isinstance(item, slice) for item in a]
         return not hasSlice
 
-    def _jargs(self, *args):
-        return JObjectArray()(list(map(sj.to_java, args)))
-
     @property
     @lru_cache(maxsize=None)
     def _op(self):
@@ -1003,6 +1657,16 @@ class RAIOperators(object):
             else None
         )
 
+    @property
+    def _shape(self):
+        shape = getattr(self, "_shape_cache", None)
+        if shape is None:
+            shape = self.shape
+            # NB: The image of a Dataset can be replaced, changing its shape.
+            if not isinstance(self, jc.Dataset):
+                self._shape_cache = shape
+        return shape
+
     @property
     def _ra(self):
         threadLocal = getattr(self, "_threadLocal", None)
@@ -1125,6 +1789,9 @@ def init(
     mode: Union[Mode, str] = Mode.HEADLESS,
     add_legacy=True,
     headless=None,
+    cache_classpath: bool = True,
+    offline: bool = False,
+    services=None,
 ):
     """Initialize an ImageJ2 environment.
 
@@ -1186,6 +1853,35 @@ def init(
 
         Deprecated. Please use the mode parameter instead.
 
+    :param cache_classpath:
+
+        Whether to cache the resolved Java classpath on disk (in
+        ~/.cache/pyimagej/classpath). If True, a later call with the same
+        arguments starts the JVM directly from the cached classpath, skipping
+        Maven resolution and the scan of local ImageJ2 installations. As with
+        jgo's own cache, a cached unversioned endpoint (e.g. the newest release
+        of ImageJ2) is not updated until the cache is cleared. Cache entries of
+        local installations are invalidated when their jars or plugins folders
+        change.
+
+    :param offline:
+
+        If True, never resolve Maven artifacts (which needs network access).
+        The environment must then come from a local ImageJ2 installation, a
+        bundle directory created with the `imagej bundle` command, or the
+        classpath cache of a previous call with the same arguments.
+
+    :param services:
+
+        The SciJava services to create the ImageJ2 gateway with, which cuts
+        the time to create its context when only a few are needed. Either
+        a list of service classes (or their fully qualified names), or
+        "minimal" for just the services needed to convert and process
+        images with ij.py, ij.convert(), ij.dataset() and ij.op(). Services
+        these depend on are included as well. The default (None) includes
+        every available service. NB: Without the LegacyService, the original
+        ImageJ is not available.
+
     :return: An instance of the net.imagej.ImageJ gateway
 
     :example:
@@ -1207,8 +1903,16 @@ def init(
     if macos and mode == Mode.INTERACTIVE:
         raise EnvironmentError("Sorry, the interactive mode is not available on macOS.")
 
+    profile = _StartupProfile()
     if not sj.jvm_started():
-        success = _create_jvm(ij_dir_or_version_or_endpoint, mode, add_legacy)
+        success = _create_jvm(
+            ij_dir_or_version_or_endpoint,
+            mode,
+            add_legacy,
+            cache_classpath,
+            offline,
+            profile,
+        )
         if not success:
             raise RuntimeError("Failed to create a JVM with the requested environment.")
 
@@ -1217,7 +1921,9 @@ def init(
         if macos:
             # NB: This will block the calling (main) thread forever!
             try:
-                setupGuiEnvironment(lambda: _create_gateway().ui().showUI())
+                setupGuiEnvironment(
+                    lambda: _create_gateway(profile, services).ui().showUI()
+                )
             except ModuleNotFoundError as e:
                 if e.msg == "No module named 'PyObjCTools'":
                     advice = (
@@ -1237,7 +1943,7 @@ def init(
                     raise
         else:
             # Create and show the application.
-            gateway = _create_gateway()
+            gateway = _create_gateway(profile, services)
             gateway.ui().showUI()
             # We are responsible for our own blocking.
             # TODO: Poll using something better than ui().isVisible().
@@ -1246,7 +1952,7 @@ def init(
             return None
     else:
         # HEADLESS or INTERACTIVE mode: create the gateway and return it.
-        return _create_gateway()
+        return _create_gateway(profile, services)
 
 
 def imagej_main():
@@ -1257,12 +1963,65 @@ def imagej_main():
     args = []
     for i in range(1, len(sys.argv)):
         args.append(sys.argv[i])
+    if args and args[0] == "bundle":
+        _bundle_main(args[1:])
+        return
     mode = "headless" if "--headless" in args else "gui"
     # Initialize imagej
     init(mode=mode)
 
 
-def _create_gateway():
+def _bundle_main(args):
+    """
+    Entry point of the `imagej bundle` command, which resolves an ImageJ2
+    environment into a self-contained bundle directory.
+    """
+    parser = argparse.ArgumentParser(
+        prog="imagej bundle",
+        description="Resolve an ImageJ2 environment into a self-contained "
+        "directory of JARs, which imagej.init(directory, offline=True) can "
+        "start from without network access.",
+    )
+    parser.add_argument("directory", help="the bundle directory to create")
+    parser.add_argument(
+        "endpoint",
+        nargs="?",
+        default=None,
+        help="version or Maven endpoint to resolve, as for imagej.init "
+        "(default: the newest release of net.imagej:imagej)",
+    )
+    parser.add_argument(
+        "--no-legacy",
+        dest="add_legacy",
+        action="store_false",
+        help="do not include support for the original ImageJ",
+    )
+    parsed = parser.parse_args(args)
+    _create_bundle(parsed.directory, parsed.endpoint, parsed.add_legacy)
+
+
+def _create_bundle(directory, ij_dir_or_version_or_endpoint=None, add_legacy=True):
+    """
+    Resolve an ImageJ2 environment, as imagej.init would, and copy its JARs
+    into a bundle directory with a manifest listing them in classpath order.
+
+    :param directory: The bundle directory to create.
+    :param ij_dir_or_version_or_endpoint: As for imagej.init.
+    :param add_legacy: As for imagej.init.
+    """
+    if not _create_jvm(
+        ij_dir_or_version_or_endpoint, Mode.HEADLESS, add_legacy, cache_classpath=False
+    ):
+        raise RuntimeError("Failed to resolve the requested environment.")
+    source = {
+        "endpoint": ij_dir_or_version_or_endpoint,
+        "add_legacy": add_legacy,
+    }
+    num_jars = _classpath.write_bundle(directory, _jvm_classpath(), source)
+    _logger.info("Bundled %d JARs into %s", num_jars, directory)
+
+
+def _create_gateway(profile=None, services=None):
     # Initialize ImageJ2
     try:
         ImageJ = jc.ImageJ
@@ -1276,7 +2035,10 @@ def _create_gateway():
         )
         return False
 
-    ij = ImageJ()
+    if services is None:
+        ij = ImageJ()
+    else:
+        ij = ImageJ(JArray(JClass("java.lang.Class"))(_service_classes(services)))
 
     # Register a Python-side script runner object, used by the
     # org.scijava:scripting-python script language plugin.
@@ -1285,11 +2047,96 @@ def _create_gateway():
 
     sj.when_jvm_stops(lambda: ij.dispose())
 
+    if profile is not None:
+        profile.mark("gateway")
+        # NB: The legacy and converters phases are timed on first use.
+        ij._startup_profile = profile
+        _logger.debug("Startup profile: %s", profile)
+
     return ij
 
 
+# Services needed by the ImageJPython image conversion and processing functions.
+_minimal_services = (
+    "net.imagej.DatasetService",
+    "net.imagej.ops.OpService",
+    "org.scijava.convert.ConvertService",
+)
+
+
+def _service_classes(services) -> list:
+    """
+    Get the Java classes of the given services (see imagej.init).
+    """
+    if isinstance(services, str):
+        if services != "minimal":
+            raise ValueError(f"Unknown services profile: {services}")
+        services = _minimal_services
+    return [sj.jclass(service) for service in services]
+
+
+class _StartupProfile:
+    """
+    Wall time and JVM heap usage of each phase of imagej.init;
+    see ImageJPython.startup_profile.
+    """
+
+    def __init__(self):
+        self.phases = []
+        self._last = time.perf_counter()
+
+    def mark(self, phase: str) -> None:
+        """Record the end of the given phase, which began at the previous mark."""
+        now = time.perf_counter()
+        self._record(phase, now - self._last)
+        self._last = now
+
+    @contextmanager
+    def optional(self, phase: str):
+        """Record the given optional phase, timed on its own."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._record(phase, time.perf_counter() - start)
+
+    def _record(self, phase: str, seconds: float) -> None:
+        self.phases.append(
+            {"phase": phase, "seconds": seconds, "heap_used": _heap_used()}
+        )
+
+    def __str__(self):
+        return ", ".join(
+            f"{p['phase']}={p['seconds']:.3f}s"
+            + ("" if p["heap_used"] is None else f"/{p['heap_used'] >> 20}MB")
+            for p in self.phases
+        )
+
+
+def _startup_phase(ij, phase: str):
+    """
+    Time an optional phase of the start-up of the given gateway (see
+    ImageJPython.startup_profile), if the gateway has a start-up profile.
+    """
+    profile = getattr(ij, "_startup_profile", None)
+    return nullcontext() if profile is None else profile.optional(phase)
+
+
+def _heap_used():
+    """Get the bytes of heap in use by the JVM, or None if it is not running."""
+    if not sj.jvm_started():
+        return None
+    runtime = sj.jimport("java.lang.Runtime").getRuntime()
+    return runtime.totalMemory() - runtime.freeMemory()
+
+
 def _create_jvm(
-    ij_dir_or_version_or_endpoint=None, mode=Mode.HEADLESS, add_legacy=True
+    ij_dir_or_version_or_endpoint=None,
+    mode=Mode.HEADLESS,
+    add_legacy=True,
+    cache_classpath=True,
+    offline=False,
+    profile=None,
 ):
     """
     Ensures the JVM is properly initialized and ready to go,
@@ -1304,6 +2151,37 @@ def _create_jvm(
     if sj.jvm_started():
         _logger.debug("The JVM is already running.")
         return False
+    if profile is None:
+        profile = _StartupProfile()
+
+    # Start from the classpath of a previous run with the same settings, if any.
+    cache_key = None
+    if cache_classpath or offline:
+        cache_key = _classpath_cache_key(
+            ij_dir_or_version_or_endpoint, mode, add_legacy
+        )
+        # NB: Entries whose JARs are gone are not loaded (see _classpath.load).
+        entry = _classpath.load(cache_key)
+        if entry is not None:
+            _logger.debug("Using cached classpath: %s", cache_key)
+            original_options = list(sj.config.get_options())
+            try:
+                profile.mark("endpoints")
+                success = _start_jvm_from_classpath(
+                    entry["classpath"], entry["options"]
+                )
+                profile.mark("start_jvm")
+                return success
+            except Exception as e:
+                # Fall back to resolving the classpath anew.
+                _logger.warning(
+                    "Failed to start the JVM from the cached classpath; "
+                    "resolving it anew."
+                )
+                _logger.debug(e, exc_info=True)
+                _classpath.clear_cache(cache_key)
+                sj.config.get_options()[:] = original_options
+    original_options = list(sj.config.get_options())
 
     # Initialize configuration.
     if mode == Mode.HEADLESS:
@@ -1323,6 +2201,7 @@ def _create_jvm(
     original_endpoints = sj.config.endpoints.copy()
     sj.config.endpoints.clear()
     init_failed = False
+    local_path = None
 
     if ij_dir_or_version_or_endpoint is None:
         # Use latest release of ImageJ2.
@@ -1344,8 +2223,15 @@ def _create_jvm(
         # Looks like a path to a local ImageJ2 installation.
         path = os.path.abspath(os.path.expanduser(ij_dir_or_version_or_endpoint))
         _logger.debug("Local path to ImageJ2 installation given: %s", path)
+        local_path = path
         add_legacy = False
-        num_jars = _set_ij_env(path)
+        bundle_jars = _classpath.load_bundle(path)
+        if bundle_jars is not None:
+            _logger.debug("Using bundle manifest of %s", path)
+            sj.config.add_classpath(*bundle_jars)
+            num_jars = len(bundle_jars)
+        else:
+            num_jars = _set_ij_env(path)
         if num_jars <= 0:
             _logger.error(
                 "Given directory does not appear to be a valid ImageJ2 installation: "
@@ -1445,6 +2331,18 @@ def _create_jvm(
     # Restore any pre-existing endpoints, after ImageJ2's.
     sj.config.endpoints.extend(original_endpoints)
 
+    if offline and len(sj.config.endpoints) > 0:
+        _logger.error(
+            "Offline initialization requires a local ImageJ2 installation, a bundle "
+            "directory (see 'imagej bundle --help'), or a previously cached "
+            "classpath, but Maven endpoints would need resolving: %s",
+            sj.config.endpoints,
+        )
+        sj.config.endpoints.clear()
+        sj.config.endpoints.extend(original_endpoints)
+        return False
+
+    profile.mark("endpoints")
     try:
         sj.start_jvm()
     except subprocess.CalledProcessError as e:
@@ -1476,7 +2374,76 @@ def _create_jvm(
         sj.config.endpoints.clear()
         sj.config.endpoints.extend(original_endpoints)
         return False
+    profile.mark("start_jvm")
+
+    if cache_classpath:
+        classpath = _jvm_classpath()
+        watched_dirs = set()
+        if local_path:
+            # NB: Any added, removed or updated JAR invalidates the entry.
+            watched_dirs.update(str(Path(local_path) / d) for d in ("jars", "plugins"))
+            watched_dirs.update(
+                os.path.dirname(jar)
+                for jar in classpath
+                if jar.startswith(local_path + os.sep)
+            )
+        options = sj.config.get_options()[len(original_options) :]
+        _classpath.save(cache_key, classpath, options, sorted(watched_dirs))
+
+    return True
 
+
+def _classpath_cache_key(ij_dir_or_version_or_endpoint, mode, add_legacy) -> str:
+    """
+    Compute the classpath cache key of the given imagej.init arguments,
+    together with the scyjava configuration and Java installation in effect.
+    """
+    ij = ij_dir_or_version_or_endpoint
+    if isinstance(ij, str):
+        if os.path.isdir(os.path.expanduser(ij)):
+            ij = os.path.abspath(os.path.expanduser(ij))
+        else:
+            ij = re.sub("\\s*", "", ij)
+    return _classpath.cache_key(
+        ij,
+        mode.value if isinstance(mode, Mode) else str(mode).lower(),
+        add_legacy,
+        sj.config.endpoints,
+        sj.config.get_classpath(),
+        sj.config.get_options(),
+        sj.config.get_repositories(),
+        os.environ.get("JAVA_HOME"),
+    )
+
+
+def _jvm_classpath() -> list:
+    """Get the elements of the running JVM's classpath, except JPype's own."""
+    System = sj.jimport("java.lang.System")
+    classpath = str(System.getProperty("java.class.path"))
+    return [
+        element
+        for element in classpath.split(os.pathsep)
+        if element and os.path.basename(element) != "org.jpype.jar"
+    ]
+
+
+def _start_jvm_from_classpath(classpath, options) -> bool:
+    """
+    Start the JVM with the given (fully resolved) classpath and JVM options,
+    bypassing any scyjava endpoints.
+
+    :return: True iff the JVM was successfully started.
+    """
+    existing = set(sj.config.get_classpath().split(os.pathsep))
+    sj.config.add_classpath(*[jar for jar in classpath if jar not in existing])
+    for option in options:
+        sj.config.add_option(option)
+    original_endpoints = sj.config.endpoints.copy()
+    sj.config.endpoints.clear()
+    try:
+        sj.start_jvm()
+    finally:
+        sj.config.endpoints.extend(original_endpoints)
     return True
 
 
@@ -0,0 +1,177 @@
+"""
+Internal utility functions for caching resolved Java classpaths on disk,
+and for bundling them into self-contained directories for offline use.
+These are not intended for external use in PyImageJ-based scripts!
+
+A cache entry records the full classpath and the JVM options of a previous
+imagej.init call, so that a later call with the same arguments can start the
+JVM directly, without resolving Maven endpoints or scanning a local ImageJ2
+installation for JARs. As with jgo's own cache, floating versions (e.g. the
+newest release of ImageJ2) stay at whatever was resolved when the entry was
+written, until the entry is cleared via clear_cache.
+"""
+import hashlib
+import json
+import logging
+import os
+import shutil
+from pathlib import Path
+from typing import Iterable, List, Optional, Sequence
+
+_logger = logging.getLogger(__name__)
+
+# Bump this when the format of cache entries changes.
+_format_version = 1
+
+# Name of the manifest file of a bundle directory.
+_bundle_manifest = "pyimagej-bundle.json"
+
+
+def cache_dir() -> Path:
+    """
+    Get the directory holding the classpath cache. This is the pyimagej folder
+    of $XDG_CACHE_HOME (by default, ~/.cache/pyimagej/classpath).
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "pyimagej" / "classpath"
+
+
+def cache_key(*args) -> str:
+    """
+    Compute the cache key identifying the given JSON-serializable arguments.
+    """
+    data = json.dumps([_format_version, *args], sort_keys=True, default=str)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def load(key: str) -> Optional[dict]:
+    """
+    Load the cache entry with the given key.
+
+    :param key: The cache key (see cache_key).
+    :return: A dict with the "classpath" and "options" of the entry, or None if
+        there is no entry, or if it is stale (i.e. any of its JARs is gone, or
+        any watched directory was modified since the entry was written).
+    """
+    path = cache_dir() / f"{key}.json"
+    try:
+        with open(path, "r") as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not _is_valid(entry):
+        _logger.debug("Ignoring stale classpath cache entry: %s", path)
+        return None
+    return entry
+
+
+def save(
+    key: str,
+    classpath: Sequence[str],
+    options: Sequence[str],
+    watched_dirs: Iterable[str] = (),
+) -> None:
+    """
+    Save a cache entry. Failures to write the cache are logged and ignored.
+
+    :param key: The cache key (see cache_key).
+    :param classpath: The resolved classpath elements.
+    :param options: The JVM options to start the JVM with.
+    :param watched_dirs: Directories whose modification invalidates the entry.
+    """
+    entry = {
+        "classpath": list(classpath),
+        "options": list(options),
+        "mtimes": {d: _mtime(d) for d in watched_dirs},
+    }
+    path = cache_dir() / f"{key}.json"
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # NB: Write atomically, since concurrent processes may share the cache.
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        _logger.debug("Failed to write classpath cache entry %s: %s", path, e)
+
+
+def clear_cache(key: Optional[str] = None) -> None:
+    """
+    Delete classpath cache entries.
+
+    :param key: The cache key (see cache_key) of the entry to delete,
+        or None to delete all entries.
+    """
+    pattern = "*.json" if key is None else f"{key}.json"
+    for path in cache_dir().glob(pattern):
+        try:
+            path.unlink()
+        except OSError as e:
+            _logger.debug("Failed to delete classpath cache entry %s: %s", path, e)
+
+
+def load_bundle(directory: str) -> Optional[List[str]]:
+    """
+    Get the classpath of a bundle directory created by write_bundle.
+
+    :param directory: The bundle directory.
+    :return: The JARs of the bundle, in classpath order,
+        or None if the directory has no bundle manifest.
+    """
+    try:
+        with open(Path(directory) / _bundle_manifest, "r") as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        return None
+    return [str(Path(directory) / jar) for jar in manifest["jars"]]
+
+
+def write_bundle(directory: str, classpath: Sequence[str], source: dict) -> int:
+    """
+    Copy the JARs of a classpath into the jars folder of a bundle directory,
+    and write a manifest listing them in classpath order.
+
+    :param directory: The bundle directory, created if needed.
+    :param classpath: The classpath elements to bundle.
+    :param source: JSON-serializable description of where the classpath came
+        from, recorded in the manifest.
+    :return: The number of bundled JARs.
+    """
+    jars_dir = Path(directory) / "jars"
+    jars_dir.mkdir(parents=True, exist_ok=True)
+    jars = []
+    for element in classpath:
+        if not os.path.isfile(element):
+            _logger.warning("Skipping non-JAR classpath element: %s", element)
+            continue
+        name = os.path.basename(element)
+        if f"jars/{name}" in jars:
+            # NB: Keep same-named JARs from different places apart.
+            name = f"{len(jars)}-{name}"
+        shutil.copy2(element, jars_dir / name)
+        jars.append(f"jars/{name}")
+    manifest = {"version": _format_version, "source": source, "jars": jars}
+    with open(Path(directory) / _bundle_manifest, "w") as f:
+        json.dump(manifest, f, indent=2)
+    return len(jars)
+
+
+def _is_valid(entry) -> bool:
+    try:
+        classpath = entry["classpath"]
+        mtimes = entry["mtimes"]
+    except (KeyError, TypeError):
+        return False
+    if not classpath:
+        return False
+    if any(_mtime(d) != mtime for d, mtime in mtimes.items()):
+        return False
+    return all(os.path.exists(element) for element in classpath)
+
+
+def _mtime(path: str) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
@@ -34,6 +34,14 @@ class MyJavaClasses(JavaClasses):
     def Double(self):
         return "java.lang.Double"
 
+    @JavaClasses.java_import
+    def Buffer(self):
+        return "java.nio.Buffer"
+
+    @JavaClasses.java_import
+    def ByteOrder(self):
+        return "java.nio.ByteOrder"
+
     @JavaClasses.java_import
     def Throwable(self):
         return "java.lang.Throwable"
@@ -42,6 +50,14 @@ class MyJavaClasses(JavaClasses):
     def ImagePlus(self):
         return "ij.ImagePlus"
 
+    @JavaClasses.java_import
+    def DataView(self):
+        return "net.imagej.display.DataView"
+
+    @JavaClasses.java_import
+    def Display(self):
+        return "org.scijava.display.Display"
+
     @JavaClasses.java_import
     def ResultsTable(self):
         return "ij.measure.ResultsTable"
@@ -66,6 +82,10 @@ class MyJavaClasses(JavaClasses):
     def EnumeratedAxis(self):
         return "net.imagej.axis.EnumeratedAxis"
 
+    @JavaClasses.java_import
+    def LinearAxis(self):
+        return "net.imagej.axis.LinearAxis"
+
     @JavaClasses.java_import
     def Dataset(self):
         return "net.imagej.Dataset"
@@ -74,6 +94,10 @@ class MyJavaClasses(JavaClasses):
     def ImageJ(self):
         return "net.imagej.ImageJ"
 
+    @JavaClasses.java_import
+    def Images(self):
+        return "net.imagej.util.Images"
+
     @JavaClasses.java_import
     def ImgPlus(self):
         return "net.imagej.ImgPlus"
@@ -102,10 +126,26 @@ class MyJavaClasses(JavaClasses):
     def Dimensions(self):
         return "net.imglib2.Dimensions"
 
+    @JavaClasses.java_import
+    def FinalInterval(self):
+        return "net.imglib2.FinalInterval"
+
     @JavaClasses.java_import
     def RandomAccessibleInterval(self):
         return "net.imglib2.RandomAccessibleInterval"
 
+    @JavaClasses.java_import
+    def IterableInterval(self):
+        return "net.imglib2.IterableInterval"
+
+    @JavaClasses.java_import
+    def Type(self):
+        return "net.imglib2.type.Type"
+
+    @JavaClasses.java_import
+    def DoubleType(self):
+        return "net.imglib2.type.numeric.real.DoubleType"
+
     @JavaClasses.java_import
     def ImgMath(self):
         return "net.imglib2.algorithm.math.ImgMath"
@@ -114,14 +154,54 @@ class MyJavaClasses(JavaClasses):
     def Img(self):
         return "net.imglib2.img.Img"
 
+    @JavaClasses.java_import
+    def ArrayImg(self):
+        return "net.imglib2.img.array.ArrayImg"
+
+    @JavaClasses.java_import
+    def ArrayImgs(self):
+        return "net.imglib2.img.array.ArrayImgs"
+
+    @JavaClasses.java_import
+    def ListImg(self):
+        return "net.imglib2.img.list.ListImg"
+
+    @JavaClasses.java_import
+    def PlanarImg(self):
+        return "net.imglib2.img.planar.PlanarImg"
+
+    @JavaClasses.java_import
+    def ImgUtil(self):
+        return "net.imglib2.util.ImgUtil"
+
     @JavaClasses.java_import
     def ImgView(self):
         return "net.imglib2.img.ImgView"
 
+    @JavaClasses.java_import
+    def Converters(self):
+        return "net.imglib2.converter.Converters"
+
+    @JavaClasses.java_import
+    def TypeIdentity(self):
+        return "net.imglib2.converter.TypeIdentity"
+
     @JavaClasses.java_import
     def ImgLabeling(self):
         return "net.imglib2.roi.labeling.ImgLabeling"
 
+    @JavaClasses.java_import
+    def ComputeMinMax(self):
+        return "net.imglib2.algorithm.stats.ComputeMinMax"
+
+    @JavaClasses.java_import
+    def Histogram1d(self):
+        return "net.imglib2.histogram.Histogram1d"
+
+    @JavaClasses.java_import
+    def Real1dBinMapper(self):
+        return "net.imglib2.histogram.Real1dBinMapper"
+
     @JavaClasses.java_import
     def Named(self):
         return "org.scijava.Named"
@@ -1,17 +1,18 @@
 """
 Utility functions for converting objects between types.
 """
+
 import ctypes
 import logging
-import os
-from typing import Dict, Sequence
+from typing import Any, Callable, Dict, Optional, Sequence
 
 import imglyb
 import numpy as np
 import scyjava as sj
 import xarray as xr
-from jpype import JByte, JException, JFloat, JLong, JObject, JShort
+from jpype import JArray, JBoolean, JByte, JDouble, JFloat, JInt, JLong, JObject, JShort
 from labeling import Labeling
+from scyjava._convert import _has_kwargs
 
 import imagej.dims as dims
 import imagej.images as images
@@ -20,6 +21,9 @@ from imagej._java import log_exception as _log_exception
 
 _logger = logging.getLogger(__name__)
 
+# Number of chunks of a chunked array (see _chunked_to_rai) kept in memory.
+_CELL_CACHE_SIZE = 64
+
 
 ###############
 # Java images #
@@ -114,7 +118,7 @@ def ndarray_to_dataset(ij: "jc.ImageJ", narr) -> "jc.Dataset":
     :return: The converted ImageJ2 Dataset
     """
     assert images.is_arraylike(narr)
-    rai = imglyb.to_imglib(narr)
+    rai = _ndarray_to_rai(narr)
     return java_to_dataset(ij, rai)
 
 
@@ -127,7 +131,7 @@ def ndarray_to_img(ij: "jc.ImageJ", narr) -> "jc.Img":
     :return: The converted ImgLib2 Img
     """
     assert images.is_arraylike(narr)
-    rai = imglyb.to_imglib(narr)
+    rai = _ndarray_to_rai(narr)
     return java_to_img(ij, rai)
 
 
@@ -158,11 +162,7 @@ def xarray_to_dataset(ij: "jc.ImageJ", xarr) -> "jc.Dataset":
     :return: The converted ImageJ2 Dataset
     """
     assert images.is_xarraylike(xarr)
-    if dims._ends_with_channel_axis(xarr):
-        vals = np.moveaxis(xarr.values, -1, 0)
-        dataset = ndarray_to_dataset(ij, vals)
-    else:
-        dataset = ndarray_to_dataset(ij, xarr.values)
+    dataset = java_to_dataset(ij, _xarray_to_rai(xarr))
     axes = dims._assign_axes(xarr)
     dataset.setAxes(axes)
     dataset.setName(xarr.name)
@@ -181,30 +181,38 @@ def xarray_to_img(ij: "jc.ImageJ", xarr) -> "jc.Img":
     :return: The converted ImgLib2 Img with inverted axes
     """
     assert images.is_xarraylike(xarr)
-    if dims._ends_with_channel_axis(xarr):
-        vals = np.moveaxis(xarr.values, -1, 0)
-        return ndarray_to_img(ij, vals)
-    else:
-        return ndarray_to_img(ij, xarr.values)
+    return java_to_img(ij, _xarray_to_rai(xarr))
 
 
-def java_to_ndarray(ij: "jc.ImageJ", jobj) -> np.ndarray:
+def java_to_ndarray(
+    ij: "jc.ImageJ", jobj, threads: Optional[int] = 1, lazy: bool = False
+) -> np.ndarray:
     """
     Convert a Java image to a NumPy ndarray,
     inverting F-style (slow axis last) to C-style (slow axis first).
 
+    If the image is stored in off-heap memory (e.g. an image wrapped from a
+    NumPy ndarray via imglyb), the returned ndarray is a view sharing that
+    memory rather than a copy; see images.ndarray_from_storage.
+
     :param ij: The ImageJ2 gateway (see imagej.init)
     :param jobj: The Java image (e.g. RandomAccessibleInterval)
+    :param threads: The number of threads to copy the image data with,
+        or None for one thread per CPU core.
+    :param lazy: If True, return a dask array instead, whose chunks are
+        copied from the Java image on demand; see images.dask_array_from_rai.
     :return: The converted NumPy ndarray with inverted axes
     """
     assert sj.isjava(jobj)
     rai = ij.convert().convert(jobj, jc.RandomAccessibleInterval)
-    narr = images.create_ndarray(rai)
-    images.copy_rai_into_ndarray(ij, rai, narr)
-    return narr
+    if lazy:
+        return images.dask_array_from_rai(ij, rai, threads)
+    return _rai_to_ndarray(ij, rai, threads)
 
 
-def java_to_xarray(ij: "jc.ImageJ", jobj) -> xr.DataArray:
+def java_to_xarray(
+    ij: "jc.ImageJ", jobj, threads: Optional[int] = 1, lazy: bool = False
+) -> xr.DataArray:
     """
     Convert a Java image to an xarray DataArray,
     inverting F-style (slow axis last) to C-style (slow axis first).
@@ -215,6 +223,11 @@ def java_to_xarray(ij: "jc.ImageJ", jobj) -> xr.DataArray:
 
     :param ij: The ImageJ2 gateway (see imagej.init)
     :param jobj: The Java image with labeled axes (e.g. Dataset or ImgPlus)
+    :param threads: The number of threads to copy the image data with,
+        or None for one thread per CPU core.
+    :param lazy: If True, back the DataArray with a dask array whose chunks
+        are copied from the Java image on demand, rather than with a NumPy
+        ndarray; see images.dask_array_from_rai.
     :return: The converted xarray DataArray with standardized axes
     """
     imgplus = ij.convert().convert(jobj, jc.ImgPlus)
@@ -222,9 +235,11 @@ def java_to_xarray(ij: "jc.ImageJ", jobj) -> xr.DataArray:
     # Permute Java image dimensions to the scikit-image standard order.
     permuted_rai = _permute_rai_to_python(imgplus)
 
-    # Create a new ndarray, and copy the Java image into it.
-    narr = images.create_ndarray(permuted_rai)
-    images.copy_rai_into_ndarray(ij, permuted_rai, narr)
+    # Obtain an ndarray (or lazy dask array) with the Java image data.
+    if lazy:
+        narr = images.dask_array_from_rai(ij, permuted_rai, threads)
+    else:
+        narr = _rai_to_ndarray(ij, permuted_rai, threads)
 
     # Wrap ndarray into an xarray with axes matching the permuted RAI.
     assert hasattr(permuted_rai, "dim_axes")
@@ -256,6 +271,28 @@ def supports_java_to_ndarray(ij: "jc.ImageJ", obj) -> bool:
         return False
 
 
+def is_image_class(obj) -> bool:
+    """
+    Return True iff the given object is of a Java class which the ConvertService
+    may convert into an image (e.g. for java_to_ndarray or java_to_xarray).
+    Unlike the supports_* functions, this depends on the class of the object
+    alone, without asking the ConvertService.
+
+    :param obj: The object to check.
+    :return: True iff the object's class is a candidate for image conversion.
+    """
+    if not sj.isjava(obj):
+        return False
+    image_classes = (
+        jc.RandomAccessibleInterval,
+        jc.DataView,
+        jc.Display,
+        jc.ImagePlus,
+    )
+    # NB: Classes which are not on the classpath (e.g. ImagePlus) are None.
+    return isinstance(obj, tuple(c for c in image_classes if c is not None))
+
+
 def supports_java_to_xarray(ij: "jc.ImageJ", obj) -> bool:
     """
     Return True iff the given object is convertible to a NumPy ndarray
@@ -296,6 +333,25 @@ _ctype_map: Dict[type, str] = {
     ctypes.c_double: "net.imglib2.type.numeric.real.DoubleType",
 }
 
+# Reverse lookup of _ctype_map, from RealType class name to ctype
+_realtype_ctypes: Dict[str, type] = {v: k for k, v in _ctype_map.items()}
+
+# ArrayImgs factory method and Java primitive type (with the NumPy dtype of
+# the same signedness) for a 1-D ArrayImg of each NumPy dtype
+_array_imgs_factories: Dict[str, tuple] = {
+    "bool": ("booleans", JBoolean, "bool"),
+    "int8": ("bytes", JByte, "int8"),
+    "uint8": ("unsignedBytes", JByte, "int8"),
+    "int16": ("shorts", JShort, "int16"),
+    "uint16": ("unsignedShorts", JShort, "int16"),
+    "int32": ("ints", JInt, "int32"),
+    "uint32": ("unsignedInts", JInt, "int32"),
+    "int64": ("longs", JLong, "int64"),
+    "uint64": ("unsignedLongs", JLong, "int64"),
+    "float32": ("floats", JFloat, "float32"),
+    "float64": ("doubles", JDouble, "float64"),
+}
+
 # Dict of casters for realtypes that cannot directly take
 # the raw conversion of ctype.value
 _realtype_casters: Dict[str, type] = {
@@ -343,10 +399,65 @@ def realtype_to_ctype(realtype: "jc.RealType"):
     # Then, convert to the python primitive
     converted = sj.to_python(jtype_raw)
     value = realtype.getClass().getName()
-    for k, v in _ctype_map.items():
-        if v == value:
-            return k(converted)
-    raise ValueError(f"Cannot convert RealType {value}")
+    if value not in _realtype_ctypes:
+        raise ValueError(f"Cannot convert RealType {value}")
+    return _realtype_ctypes[value](converted)
+
+
+def ndarray_to_realtypes(narr: np.ndarray) -> "jc.Img":
+    """
+    Convert the given 1-D NumPy ndarray into a 1-D ImgLib2 ArrayImg of the
+    equivalent RealType, whose elements hold the values of the ndarray.
+
+    Rather than converting one value at a time (see ctype_to_realtype), the
+    values are copied into a Java primitive array in one bulk transfer. The
+    resulting ArrayImg is an Iterable of RealTypes, e.g. as input to Ops.
+
+    :param narr: The 1-D NumPy ndarray
+    :return: The ArrayImg holding a copy of the values
+    """
+    narr = np.asarray(narr)
+    if narr.ndim != 1:
+        raise ValueError(f"Expected a 1-D array, but got {narr.ndim} dimensions")
+    if narr.dtype.name not in _array_imgs_factories:
+        raise TypeError(f"Unsupported dtype: {narr.dtype}")
+    method, jtype, signed_dtype = _array_imgs_factories[narr.dtype.name]
+    values = np.ascontiguousarray(narr).view(signed_dtype)
+    return getattr(jc.ArrayImgs, method)(JArray(jtype)(values), JLong(len(values)))
+
+
+def realtypes_to_ndarray(ij: "jc.ImageJ", realtypes) -> np.ndarray:
+    """
+    Convert the given Java collection (e.g. java.util.List) or 1-D image of
+    RealTypes, all of the same class, into a 1-D NumPy ndarray of the
+    equivalent dtype.
+
+    Rather than converting one value at a time (see realtype_to_ctype), the
+    values are copied on the Java side, in one bulk transfer.
+
+    :param ij: The ImageJ2 gateway (see imagej.init)
+    :param realtypes: The Java Collection or RandomAccessibleInterval
+    :return: The NumPy ndarray holding a copy of the values
+    :raises ValueError: If the collection is empty, since its dtype is unknown
+    """
+    if isinstance(realtypes, jc.RandomAccessibleInterval):
+        if realtypes.numDimensions() != 1:
+            raise ValueError("Expected a 1-D image")
+        return java_to_ndarray(ij, realtypes)
+    size = realtypes.size()
+    if size == 0:
+        raise ValueError("Cannot infer the dtype of an empty collection of RealTypes")
+    fqcn = realtypes.iterator().next().getClass().getName()
+    if fqcn not in _realtype_ctypes:
+        raise ValueError(f"Cannot convert RealType {fqcn}")
+    dtype = np.dtype(_realtype_ctypes[fqcn])
+    if dtype == np.bool_:
+        # NB: BoolType is not a NativeType, so it cannot be bulk copied into
+        # the NativeBoolType of an ndarray wrapped via imglyb.
+        return np.array([t.get() for t in realtypes], dtype=dtype)
+    narr = np.empty(size, dtype=dtype)
+    images.copy_rai_into_ndarray(ij, jc.ListImg(realtypes, JLong(size)), narr)
+    return narr
 
 
 def supports_ctype_to_realtype(obj):
@@ -371,7 +482,7 @@ def supports_realtype_to_ctype(obj):
     if not isinstance(obj, sj.jimport("net.imglib2.type.numeric.RealType")):
         return False
     fqcn = obj.getClass().getName()
-    return fqcn in _ctype_map.values()
+    return fqcn in _realtype_ctypes
 
 
 ############################
@@ -383,27 +494,23 @@ def labeling_to_imglabeling(ij: "jc.ImageJ", labeling: Labeling):
     """
     Convert a Python Labeling to an equivalent Java ImgLabeling.
 
+    The Labeling's index image is wrapped without copying via imglyb,
+    so the resulting ImgLabeling shares its memory.
+
     :param ij: The ImageJ2 gateway (see imagej.init)
     :param labeling: the Python Labeling
     :return: a Java ImgLabeling
     """
-    labeling_io_service = ij.context().service(jc.LabelingIOService)
+    index_img, label_data = labeling.get_result()
+    index_rai = _ndarray_to_rai(np.ascontiguousarray(index_img))
 
-    # Save the image on the Python side
-    tmp_pth = "./tmp"
-    _delete_labeling_files(tmp_pth)
-    labeling.save_result(tmp_pth)
-
-    # Load the labeling on the Java side
-    try:
-        tmp_pth_json = tmp_pth + ".lbl.json"
-        imglabeling = labeling_io_service.load(tmp_pth_json, JObject, JObject)
-    except JException as exc:
-        _delete_labeling_files(tmp_pth)
-        raise exc
-    _delete_labeling_files(tmp_pth)
+    # NB: Label set i is the set of labels of index image pixel value i.
+    indices = [int(index) for index in label_data.labelSets]
+    label_sets = [set() for _ in range(max(indices, default=0) + 1)]
+    for index, labels in label_data.labelSets.items():
+        label_sets[int(index)] = set(labels)
 
-    return imglabeling
+    return jc.ImgLabeling.fromImageAndLabelSets(index_rai, sj.to_java(label_sets))
 
 
 def imglabeling_to_labeling(ij: "jc.ImageJ", imglabeling: "jc.ImgLabeling"):
@@ -414,24 +521,16 @@ def imglabeling_to_labeling(ij: "jc.ImageJ", imglabeling: "jc.ImgLabeling"):
     :param imglabeling: the Java ImgLabeling
     :return: a Python Labeling
     """
-    labeling_io_service = ij.context().service(jc.LabelingIOService)
+    imglabeling = ij.convert().convert(imglabeling, jc.ImgLabeling)
+    index_img = java_to_ndarray(ij, imglabeling.getIndexImg())
+    mapping = imglabeling.getMapping()
 
-    # Save the image on the Python side
-    tmp_pth = os.getcwd() + "/tmp"
-    tmp_pth_json = tmp_pth + ".lbl.json"
-    tmp_pth_tif = tmp_pth + ".tif"
-    try:
-        _delete_labeling_files(tmp_pth)
-        imglabeling = ij.convert().convert(imglabeling, jc.ImgLabeling)
-        labeling_io_service.save(
-            imglabeling, tmp_pth_tif
-        )  # TODO: improve, likely utilizing the ImgLabeling's name
-    except JException:
-        print("Failed to save the data")
-
-    # Load the labeling on the python side
-    labeling = Labeling.from_file(tmp_pth_json)
-    _delete_labeling_files(tmp_pth)
+    labeling = Labeling(shape=index_img.shape, type=index_img.dtype)
+    labeling.result_image = index_img
+    labeling.label_sets = {
+        str(index): {sj.to_python(label) for label in mapping.labelsAtIndex(index)}
+        for index in range(mapping.numSets())
+    }
     return labeling
 
 
@@ -522,6 +621,132 @@ def results_table_to_scijava_table(
     return ij.convert().convert(table, jc.Table)
 
 
+######################
+# Converter dispatch #
+######################
+
+
+class _ConverterCache:
+    """
+    A group of scyjava converters of one priority, added to scyjava as a single
+    converter which dispatches to the first converter of the group supporting
+    an object. The candidates are memoized by the type of the object (for Java
+    objects, their Java class): the predicates of converters added with
+    by_type=True are evaluated once per type, so they must depend on the type
+    of the object alone, and ignore any hints. Other predicates (e.g. those
+    asking the ConvertService, whose answer may depend on the object itself)
+    are evaluated for every object whose type passes their type_check.
+
+    :param priority: The priority of the group within scyjava's converters.
+    """
+
+    def __init__(self, priority: float):
+        self.priority = priority
+        self._converters = []
+        self._dispatch = {}
+        self._last = None
+
+    def add(
+        self,
+        converter: sj.Converter,
+        by_type: bool = True,
+        type_check: Optional[Callable[[Any], bool]] = None,
+    ) -> None:
+        """
+        Add a converter to the group, invalidating the memoized choices.
+
+        :param converter: The converter, of the priority of the group.
+        :param by_type: Whether the converter's predicate depends on the type
+            of the object alone, such that its result can be memoized per type.
+        :param type_check: For converters with by_type=False, an optional
+            predicate depending on the type of the object alone (memoized per
+            type), which the object must pass for the converter's own
+            predicate to be evaluated at all.
+        """
+        if converter.priority != self.priority:
+            raise ValueError(
+                f"Converter priority {converter.priority} does not match "
+                f"the priority {self.priority} of its group"
+            )
+        self._converters.append((converter, by_type, type_check))
+        self._dispatch.clear()
+
+    def supports(self, obj) -> bool:
+        entry = self._lookup(obj)
+        if entry is not None:
+            # NB: scyjava calls convert right after supports; reuse the match,
+            # rather than evaluating the per-object predicates again.
+            self._last = obj, entry
+        return entry is not None
+
+    def convert(self, obj, **hints):
+        last, self._last = self._last, None
+        # NB: Another thread may have converted another object in between.
+        entry = last[1] if last is not None and last[0] is obj else None
+        converter, with_hints = entry or self._lookup(obj)
+        return converter(obj, **hints) if with_hints else converter(obj)
+
+    def converter(self) -> sj.Converter:
+        """Get the scyjava converter dispatching to the group."""
+        return sj.Converter(
+            predicate=self.supports, converter=self.convert, priority=self.priority
+        )
+
+    def _lookup(self, obj):
+        key = type(obj)
+        try:
+            candidates = self._dispatch[key]
+        except KeyError:
+            candidates = self._dispatch[key] = self._candidates(obj)
+        for predicate, entry in candidates:
+            if predicate is None or predicate(obj):
+                return entry
+        return None
+
+    def _candidates(self, obj) -> list:
+        # NB: As in scyjava, the last added of equal priority converters wins.
+        candidates = []
+        for converter, by_type, type_check in reversed(self._converters):
+            entry = converter.converter, _has_kwargs(converter.converter)
+            if not by_type:
+                if type_check is None or type_check(obj):
+                    candidates.append((converter.predicate, entry))
+            elif converter.predicate(obj):
+                candidates.append((None, entry))
+                break
+        return candidates
+
+
+class _ConverterGroups:
+    """
+    Converters to be added to scyjava as one _ConverterCache per priority, such
+    that they keep their order relative to each other and to other converters.
+    """
+
+    def __init__(self):
+        self.groups: Dict[float, _ConverterCache] = {}
+
+    def add(
+        self,
+        converter: sj.Converter,
+        by_type: bool = True,
+        type_check: Optional[Callable[[Any], bool]] = None,
+    ) -> None:
+        """Add a converter to the group of its priority; see _ConverterCache.add."""
+        if converter.priority not in self.groups:
+            self.groups[converter.priority] = _ConverterCache(converter.priority)
+        self.groups[converter.priority].add(converter, by_type, type_check)
+
+    def register(self, add_converter) -> None:
+        """
+        Add the groups to scyjava.
+
+        :param add_converter: sj.add_java_converter or sj.add_py_converter.
+        """
+        for group in self.groups.values():
+            add_converter(group.converter())
+
+
 ####################
 # Helper functions #
 ####################
@@ -567,6 +792,72 @@ def _permute_rai_to_python(rich_rai: "jc.RandomAccessibleInterval"):
     return permuted_rai
 
 
+def _rai_to_ndarray(
+    ij: "jc.ImageJ", rai: "jc.RandomAccessibleInterval", threads: Optional[int] = 1
+):
+    """
+    Obtain the data of a RandomAccessibleInterval as a NumPy ndarray,
+    directly from the image's storage where possible, or else by copying.
+    """
+    narr = images.ndarray_from_storage(rai)
+    if narr is None:
+        narr = images.create_ndarray(rai)
+        images.copy_rai_into_ndarray(ij, rai, narr, threads=threads)
+    return narr
+
+
+def _xarray_to_rai(xarr: xr.DataArray) -> "jc.RandomAccessibleInterval":
+    """
+    Wrap the data of an xarray DataArray into a RandomAccessibleInterval
+    without copying, inverting C-style to F-style. A trailing channel axis
+    becomes the last (slowest) dimension of the RandomAccessibleInterval,
+    via a Java-side view over the data wrapped in its original layout.
+
+    NumPy data is wrapped directly (see _ndarray_to_rai). Chunked data (e.g.
+    a dask array) is not materialized, but wrapped lazily (see _chunked_to_rai).
+    """
+    data = xarr.data
+    if isinstance(data, np.ndarray):
+        rai = _ndarray_to_rai(data)
+    elif hasattr(data, "chunksize"):
+        rai = _chunked_to_rai(data)
+    else:
+        rai = _ndarray_to_rai(xarr.values)
+    if dims._ends_with_channel_axis(xarr):
+        rai = jc.Views.moveAxis(rai, 0, rai.numDimensions() - 1)
+    return rai
+
+
+def _chunked_to_rai(arr) -> "jc.RandomAccessibleInterval":
+    """
+    Wrap a chunked array (e.g. a dask array) into an ImgLib2 cached cell image
+    via imglyb, inverting C-style to F-style. Each cell is one chunk of the
+    array, computed as a NumPy array when first accessed, and evicted again
+    when memory runs low. Writes to the image do not reach the chunked array.
+    """
+    img, _ = imglyb.as_cell_img(
+        arr, arr.chunksize, _CELL_CACHE_SIZE, chunk_as_array=np.asarray
+    )
+    return img
+
+
+def _ndarray_to_rai(narr: np.ndarray) -> "jc.RandomAccessibleInterval":
+    """
+    Wrap a NumPy ndarray into a RandomAccessibleInterval via imglyb, without
+    copying, inverting C-style to F-style. This includes memory-mapped arrays
+    (e.g. from images.open_memmap), whose pages are then read on demand.
+
+    Read-only arrays are wrapped into a view which discards writes, since the
+    JVM would crash writing to read-only memory (e.g. a memory map in mode "r").
+    """
+    rai = imglyb.to_imglib(narr)
+    if narr.flags["WRITEABLE"]:
+        return rai
+    t = jc.Util.getTypeFromInterval(rai).createVariable()
+    rai = JObject(rai, jc.RandomAccessibleInterval)
+    return jc.Converters.convert(rai, jc.TypeIdentity(), t)
+
+
 def _rename_xarray_dims(xarr, new_dims: Sequence[str]):
     curr_dims = xarr.dims
     if not new_dims:
@@ -580,19 +871,6 @@ def _rename_xarray_dims(xarr, new_dims: Sequence[str]):
     return xarr.rename(dim_map)
 
 
-def _delete_labeling_files(filepath):
-    """
-    Removes any Labeling data left over at filepath
-    :param filepath: the filepath where Labeling (might have) saved data
-    """
-    pth_json = filepath + ".lbl.json"
-    pth_tif = filepath + ".tif"
-    if os.path.exists(pth_tif):
-        os.remove(pth_tif)
-    if os.path.exists(pth_json):
-        os.remove(pth_json)
-
-
 def _dim_order(hints: Dict):
     """
     Extract the dim_order from the hints kwargs.
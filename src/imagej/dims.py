@@ -2,12 +2,13 @@
 Utility functions for querying and manipulating dimensional axis metadata.
 """
 import logging
+from functools import lru_cache
 from typing import List, Tuple, Union
 
 import numpy as np
 import scyjava as sj
 import xarray as xr
-from jpype import JException, JObject
+from jpype import JArray, JDouble, JException, JObject
 
 from imagej._java import jc
 from imagej.images import is_arraylike as _is_arraylike
@@ -207,7 +208,7 @@ def _assign_axes(
                 f"The {ax_type.getLabel()} axis is non-numeric and is translated "
                 "to a linear index."
             )
-            coords_arr = [np.double(x) for x in np.arange(len(xarr.coords[dim]))]
+            coords_arr = np.arange(len(xarr.coords[dim]), dtype=np.double)
         else:
             coords_arr = coords_arr.to_numpy().astype(np.double)
 
@@ -217,8 +218,8 @@ def _assign_axes(
 
         if not linear:
             try:
-                j_coords = [jc.Double(x) for x in coords_arr]
-                axes[ax_num] = jc.EnumeratedAxis(ax_type, sj.to_java(j_coords))
+                enumerated_axis = _get_enumerated_axis(axis_str, coords_arr.tobytes())
+                axes[ax_num] = enumerated_axis.copy()
             except (JException, TypeError):
                 # if EnumeratedAxis not available - use DefaultLinearAxis
                 axes[ax_num] = _get_default_linear_axis(coords_arr, ax_type)
@@ -247,7 +248,8 @@ def _get_axis_num(xarr: xr.DataArray, axis):
     :return: Axis idx in java
     """
     py_axnum = xarr.get_axis_num(axis)
-    if np.isfortran(xarr.values):
+    # NB: Check the data itself, since xarr.values would compute a dask array.
+    if isinstance(xarr.data, np.ndarray) and np.isfortran(xarr.data):
         return py_axnum
 
     if _ends_with_channel_axis(xarr):
@@ -270,14 +272,124 @@ def _get_axes_coords(
     :return: Dictionary of coordinates for each axis.
     """
     coords = {
-        dims[idx]: [
-            axes[idx].calibratedValue(position) for position in range(shape[idx])
-        ]
-        for idx in range(len(dims))
+        dims[idx]: _get_axis_coords(axes[idx], shape[idx]) for idx in range(len(dims))
     }
     return coords
 
 
+def _get_axis_coords(axis: "jc.CalibratedAxis", length: int) -> np.ndarray:
+    """
+    Get the calibrated coordinates of an ImageJ axis as a NumPy array.
+
+    Linear axes are computed from their origin and scale, and enumerated axes
+    are read from their values in one transfer; other axes fall back to
+    querying the calibrated value of each position.
+
+    :param axis: An ImageJ CalibratedAxis.
+    :param length: The number of positions along the axis.
+    :return: A 1D NumPy array of the axis coordinates.
+    """
+    if isinstance(axis, jc.LinearAxis):
+        return axis.origin() + axis.scale() * np.arange(length, dtype=np.double)
+    if jc.EnumeratedAxis and isinstance(axis, jc.EnumeratedAxis):
+        values = _get_enumerated_axis_values(axis, length)
+        if values is not None:
+            return values
+    return np.array(
+        [axis.calibratedValue(position) for position in range(length)], dtype=np.double
+    )
+
+
+def _get_enumerated_axis_values(axis: "jc.EnumeratedAxis", length: int):
+    """
+    Get the first values of an EnumeratedAxis as a NumPy array, via a single
+    transfer of its backing double[]. Since that field is not public API, its
+    values are only used if they agree with the public calibratedValue method
+    at both ends of the axis.
+
+    :param axis: An ImageJ EnumeratedAxis.
+    :param length: The number of positions along the axis.
+    :return: A 1D NumPy array of the axis values, or None if inaccessible, in
+        which case the values must be obtained via calibratedValue instead.
+    """
+    field = _enumerated_axis_values_field()
+    if field is None:
+        return None
+    try:
+        values = jc.ClassUtils.getValue(field, axis)
+        values = None if values is None else np.array(values, dtype=np.double)
+    except (JException, TypeError, ValueError):
+        return None
+    if values is None or values.ndim != 1 or len(values) < length:
+        return None
+    values = values[:length]
+    if length > 0 and (
+        values[0] != axis.calibratedValue(0)
+        or values[-1] != axis.calibratedValue(length - 1)
+    ):
+        return None
+    return values
+
+
+@lru_cache(maxsize=None)
+def _enumerated_axis_values_field():
+    """Get the field holding the values of an EnumeratedAxis, if any."""
+    try:
+        return jc.ClassUtils.getField(jc.EnumeratedAxis, "values")
+    except JException:
+        return None
+
+
+def _get_dimension_index(
+    rai: "jc.RandomAccessibleInterval", axis: Union[str, int]
+) -> int:
+    """
+    Get the index of a RandomAccessibleInterval dimension.
+
+    :param rai: A RandomAccessibleInterval.
+    :param axis: A dimension label in Python/NumPy or ImageJ convention
+        (requires an image with axes, e.g. Dataset or ImgPlus), or an axis
+        index in NumPy order (i.e. reversed relative to the image).
+    :return: The index of the dimension in the RandomAccessibleInterval.
+    """
+    ndim = rai.numDimensions()
+    if isinstance(axis, str):
+        if not _has_axis(rai):
+            raise ValueError(f"Image has no labeled axes; cannot find axis '{axis}'")
+        labels = _get_axis_labels(rai.dim_axes)
+        label = _convert_dim(axis, "java")
+        if label not in labels:
+            raise ValueError(f"No such axis: '{axis}' (image axes: {labels})")
+        return labels.index(label)
+    if not -ndim <= axis < ndim:
+        raise IndexError(f"axis {axis} is out of bounds for {ndim} dimensions")
+    return ndim - 1 - (axis % ndim)
+
+
+# NB: Keyed on the coordinates' bytes, so keep only a few recent axes.
+@lru_cache(maxsize=16)
+def _get_enumerated_axis(axis_str: str, coords_bytes: bytes) -> "jc.EnumeratedAxis":
+    """
+    Create a new EnumeratedAxis with the given axis type and coordinates.
+
+    The coordinates are passed to Java as a single double[] where possible.
+    Axes are cached by their coordinates, so images sharing the same irregular
+    axis reuse it; callers must copy the returned axis before using it.
+
+    :param axis_str: The label of the axis type.
+    :param coords_bytes: The bytes of a 1D float64 NumPy array of coordinates.
+    :return: An instance of net.imagej.axis.EnumeratedAxis.
+    """
+    ax_type = jc.Axes.get(axis_str)
+    coords_arr = np.frombuffer(coords_bytes, dtype=np.double)
+    try:
+        return jc.EnumeratedAxis(ax_type, JArray(JDouble)(coords_arr))
+    except TypeError:
+        # no double[] constructor - box each coordinate into a List<Double>
+        j_coords = [jc.Double(x) for x in coords_arr]
+        return jc.EnumeratedAxis(ax_type, sj.to_java(j_coords))
+
+
 def _get_default_linear_axis(coords_arr: np.ndarray, ax_type: "jc.AxisType"):
     """
     Create a new DefaultLinearAxis with the given coordinate array and axis type.
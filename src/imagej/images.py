@@ -1,15 +1,28 @@
 """
 Utility functions for creating and working with images.
 """
+import atexit
 import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional
 
+import imglyb
 import numpy as np
 import scyjava as sj
+from jpype import JArray, JLong
 
 from imagej._java import jc
 
 _logger = logging.getLogger(__name__)
 
+# The thread pool for concurrent copies, and its number of threads.
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_threads = 0
+_executor_lock = threading.Lock()
+
 
 # fmt: off
 _imglib2_types = {
@@ -43,6 +56,12 @@ _imglib2_types = {
 }
 # fmt: on
 
+# Wrappers which pass pixel access through to their source unchanged.
+_transparent_wrappers = (
+    "net.imglib2.img.ImgView",
+    "net.imglib2.python.ReferenceGuardingRandomAccessibleInterval",
+)
+
 
 def is_arraylike(arr):
     """
@@ -92,6 +111,38 @@ def is_xarraylike(xarr):
     )
 
 
+def open_memmap(
+    path,
+    dtype=None,
+    shape=None,
+    offset: int = 0,
+    order: str = "C",
+    mode: str = "r",
+) -> np.memmap:
+    """
+    Map an image file into memory, without reading it. Converting the result
+    via ij.py.to_java, ij.py.to_img or ij.py.to_dataset yields a Java image
+    backed by the same mapped pages, so that images larger than the available
+    memory can be processed.
+
+    :param path: The path to a NumPy .npy file, or to a raw file of pixel data.
+    :param dtype: The dtype of the pixels of a raw file.
+    :param shape: The shape (in NumPy order) of the image of a raw file.
+    :param offset: The offset in bytes of the pixel data of a raw file.
+    :param order: The memory order of the pixels of a raw file: "C" or "F".
+    :param mode: The mode to map the file in (see numpy.memmap). In the default
+        read-only mode, Java images of the data discard writes to their pixels.
+    :return: The memory-mapped ndarray.
+    """
+    if os.fspath(path).endswith(".npy"):
+        return np.load(path, mmap_mode=mode)
+    if dtype is None or shape is None:
+        raise ValueError("The dtype and shape of a raw image file are required")
+    return np.memmap(
+        path, dtype=dtype, mode=mode, offset=offset, shape=tuple(shape), order=order
+    )
+
+
 def create_ndarray(image) -> np.ndarray:
     """
     Create a NumPy ndarray with the same dimensions as the given image.
@@ -115,49 +166,197 @@ def create_ndarray(image) -> np.ndarray:
 
 
 def copy_rai_into_ndarray(
-    ij: "jc.ImageJ", rai: "jc.RandomAccessibleInterval", narr: np.ndarray
+    ij: "jc.ImageJ",
+    rai: "jc.RandomAccessibleInterval",
+    narr: np.ndarray,
+    threads: Optional[int] = 1,
 ) -> None:
     """
     Copy an ImgLib2 RandomAccessibleInterval into a NumPy ndarray.
 
     The input RandomAccessibleInterval is copied into the pre-initialized
     NumPy ndarray with either "fast copy" via 'net.imglib2.util.ImgUtil.copy'
-    if available or the slower "copy.rai" method. Note that the input
-    RandomAccessibleInterval and NumPy ndarray must have reversed dimensions
-    relative to each other (e.g. [t, z, y, x, c] and [c, x, y, z, t]).
+    if available or the slower "copy.rai" method; see copy_strategy. Note that
+    the input RandomAccessibleInterval and NumPy ndarray must have reversed
+    dimensions relative to each other (e.g. [t, z, y, x, c] and [c, x, y, z, t]).
+
+    With more than one thread, the interval is split along its slowest axis
+    (the last RandomAccessibleInterval dimension, i.e. the first ndarray axis)
+    into chunks which are copied concurrently. The threads spend their time
+    inside Java calls, during which the GIL is released.
 
     :param ij: The ImageJ2 gateway (see imagej.init)
     :param rai: The RandomAccessibleInterval.
     :param narr: A NumPy ndarray with the same (reversed) shape
         as the input RandomAccessibleInterval.
+    :param threads: The number of threads to copy with,
+        or None for one thread per CPU core.
     """
     if not isinstance(rai, jc.RandomAccessibleInterval):
         raise TypeError("rai is not a RAI")
     if not is_arraylike(narr):
         raise TypeError("narr is not arraylike")
 
+    copy = _copy_strategies[copy_strategy()]
+    if threads is None:
+        threads = os.cpu_count() or 1
+    ndim = rai.numDimensions()
+    length = rai.dimension(ndim - 1) if ndim > 0 else 0
+    chunk_count = min(threads, length)
+    if chunk_count <= 1:
+        copy(ij, rai, narr)
+        return
+
+    # Split the slowest axis into contiguous chunks, one per thread.
+    futures = [
+        _copy_executor(chunk_count).submit(copy, ij, chunk, narr[start:stop])
+        for chunk, start, stop in _slabs(rai, chunk_count)
+    ]
+    for future in futures:
+        # NB: Propagate any exception raised while copying a chunk.
+        future.result()
+
+
+@lru_cache(maxsize=None)
+def copy_strategy() -> str:
+    """
+    Get the name of the strategy copy_rai_into_ndarray uses to copy pixels.
+
+    The strategy is chosen once, on first use, according to the versions of
+    ImgLib2 and ImageJ Common available on the classpath, and reused for all
+    subsequent copies:
+
+    * "ImgUtil.copy" - net.imglib2.util.ImgUtil.copy (ImgLib2 5.9.0+)
+    * "Images.copy" - net.imagej.util.Images.copy (ImageJ Common 0.30.0+)
+    * "copy.rai" - the ImageJ Ops copy.rai op
+
+    :return: The name of the copy strategy.
+    """
     # Check imglib2 version for fast copy availability.
     imglib2_version = sj.get_version(jc.RandomAccessibleInterval)
     if sj.is_version_at_least(imglib2_version, "5.9.0"):
         # ImgLib2 is new enough to use net.imglib2.util.ImgUtil.copy.
-        ImgUtil = sj.jimport("net.imglib2.util.ImgUtil")
-        ImgUtil.copy(rai, sj.to_java(narr))
-        return narr
-
-    # Check imagej-common version for fast copy availability.
-    imagej_common_version = sj.get_version(jc.Dataset)
-    if sj.is_version_at_least(imagej_common_version, "0.30.0"):
+        strategy = "ImgUtil.copy"
+    elif sj.is_version_at_least(sj.get_version(jc.Dataset), "0.30.0"):
         # ImageJ Common is new enough to use (deprecated)
         # net.imagej.util.Images.copy.
-        Images = sj.jimport("net.imagej.util.Images")
-        Images.copy(rai, sj.to_java(narr))
-        return narr
-
-    # Fall back to copying with ImageJ Ops's copy.rai op. In theory, Ops
-    # should always be faster. But in practice, the copy.rai operation is
-    # slower than the hardcoded ones above. If we were to fix Ops to be
-    # fast always, we could eliminate the above special casing.
-    ij.op().run("copy.rai", sj.to_java(narr), rai)
+        strategy = "Images.copy"
+    else:
+        # Fall back to copying with ImageJ Ops's copy.rai op. In theory, Ops
+        # should always be faster. But in practice, the copy.rai operation is
+        # slower than the hardcoded ones above. If we were to fix Ops to be
+        # fast always, we could eliminate the above special casing.
+        strategy = "copy.rai"
+    _logger.debug("Copying images into NumPy ndarrays via %s", strategy)
+    return strategy
+
+
+def ndarray_from_storage(
+    rai: "jc.RandomAccessibleInterval", copy: bool = True
+) -> Optional[np.ndarray]:
+    """
+    Obtain a NumPy ndarray directly from the storage backing an ImgLib2 image.
+
+    Images stored in a single block of off-heap memory (e.g. an ArrayImg
+    wrapping a NumPy ndarray via imglyb, or backed by a direct NIO buffer)
+    are wrapped without copying, so the returned ndarray shares memory with
+    the Java image. Images stored in Java primitive arrays (ArrayImg and
+    PlanarImg) are transferred with one bulk copy per array, rather than
+    pixel by pixel. As with copy_rai_into_ndarray, the returned ndarray has
+    reversed dimensions relative to the input RandomAccessibleInterval.
+
+    :param rai: The RandomAccessibleInterval (e.g. Img, ImgPlus or Dataset).
+    :param copy: If False, only storage which can be wrapped without copying
+        is accessed, so that writes to the returned ndarray reach the image.
+    :return: A NumPy ndarray with the image data, or None if the image's
+        storage cannot be accessed directly (e.g. views, cell images or
+        bit-packed types), in which case copy_rai_into_ndarray must be used.
+    """
+    img = _unwrap_img(rai)
+    # NB: The planes of a PlanarImg are always copied into one ndarray.
+    if not isinstance(img, (jc.ArrayImg, jc.PlanarImg) if copy else jc.ArrayImg):
+        return None
+    try:
+        dtype_to_use = dtype(img)
+    except TypeError:
+        return None
+    shape = tuple(reversed(img.shape))
+
+    if isinstance(img, jc.ArrayImg):
+        access = img.update(None)
+        if "basictypelongaccess.unsafe" in str(access.getClass().getName()):
+            # Off-heap memory (e.g. allocated by NumPy): wrap it in place.
+            try:
+                narr = imglyb.to_numpy(img)
+            except (KeyError, ValueError):
+                return None
+            # NB: Keep the outermost wrapper alive along with the ndarray, since
+            # it may be what guards the memory (e.g. imglyb reference guards).
+            narr.rai = rai
+            return narr
+        narr = _access_to_ndarray(access, dtype_to_use, img.size(), copy=copy)
+        return None if narr is None else narr.reshape(shape)
+
+    # PlanarImg: one primitive array per plane, in F-style order.
+    narr = np.empty(shape, dtype=dtype_to_use)
+    planes = narr.reshape(img.numSlices(), -1)
+    for i in range(img.numSlices()):
+        plane = _access_to_ndarray(img.getPlane(i), dtype_to_use, planes.shape[1])
+        if plane is None:
+            return None
+        planes[i] = plane
+    return narr
+
+
+def dask_array_from_rai(
+    ij: "jc.ImageJ", rai: "jc.RandomAccessibleInterval", threads: Optional[int] = 1
+):
+    """
+    Wrap an ImgLib2 RandomAccessibleInterval into a lazy dask array.
+
+    No image data is copied up front: each chunk of the dask array is copied
+    out of the RandomAccessibleInterval on demand, when it is computed. The
+    array is chunked by plane: each chunk spans the X, Y and channel axes of
+    images with axes (e.g. Dataset or ImgPlus), or else the two fastest
+    RandomAccessibleInterval dimensions. As with create_ndarray, the dask
+    array has reversed dimensions relative to the RandomAccessibleInterval.
+
+    Requires dask to be installed.
+
+    :param ij: The ImageJ2 gateway (see imagej.init)
+    :param rai: The RandomAccessibleInterval.
+    :param threads: The number of threads to copy each chunk with,
+        or None for one thread per CPU core.
+    :return: A dask array backed by the RandomAccessibleInterval.
+    """
+    # NB: Import dask on demand, so that it is only needed for lazy images.
+    import dask.array as da
+
+    reader = _RAIChunkReader(ij, rai, threads)
+    return da.from_array(
+        reader,
+        chunks=_plane_chunks(rai),
+        name=False,
+        asarray=False,
+        fancy=False,
+        meta=np.empty((0,) * reader.ndim, dtype=reader.dtype),
+    )
+
+
+def _plane_chunks(rai: "jc.RandomAccessibleInterval") -> tuple:
+    """
+    Get dask chunk sizes spanning whole planes of the given image, reversed
+    relative to its dimensions: -1 (whole axis) for the X, Y and channel axes,
+    or else the two fastest dimensions, and 1 for all others.
+    """
+    ndim = rai.numDimensions()
+    whole = [d < 2 for d in range(ndim)]
+    if hasattr(rai, "axis"):
+        types = [rai.axis(d).type() for d in range(ndim)]
+        if jc.Axes.X in types or jc.Axes.Y in types:
+            plane_types = (jc.Axes.X, jc.Axes.Y, jc.Axes.CHANNEL)
+            whole = [t in plane_types for t in types]
+    return tuple(-1 if w else 1 for w in reversed(whole))
 
 
 def dtype(image_or_type) -> np.dtype:
@@ -185,14 +384,14 @@ def dtype(image_or_type) -> np.dtype:
         raise TypeError("Unsupported type: " + str(type(image_or_type)))
 
     # -- ImgLib2 types --
-    if isinstance(image_or_type, sj.jimport("net.imglib2.type.Type")):
-        for c in _imglib2_types:
-            if isinstance(image_or_type, sj.jimport(c)):
-                return np.dtype(_imglib2_types[c])
-        raise TypeError(f"Unsupported ImgLib2 type: {image_or_type}")
+    if isinstance(image_or_type, jc.Type):
+        result = _imglib2_type_dtype(str(image_or_type.getClass().getName()))
+        if result is None:
+            raise TypeError(f"Unsupported ImgLib2 type: {image_or_type}")
+        return result
 
     # -- ImgLib2 images --
-    if isinstance(image_or_type, sj.jimport("net.imglib2.IterableInterval")):
+    if isinstance(image_or_type, jc.IterableInterval):
         imglib2_type = image_or_type.firstElement()
         return dtype(imglib2_type)
     if isinstance(image_or_type, jc.RandomAccessibleInterval):
@@ -202,15 +401,251 @@ def dtype(image_or_type) -> np.dtype:
     # -- Original ImageJ images --
     if jc.ImagePlus and isinstance(image_or_type, jc.ImagePlus):
         imagej_type = image_or_type.getType()
-        imagej_types = {
-            jc.ImagePlus.GRAY8: "uint8",
-            jc.ImagePlus.GRAY16: "uint16",
-            # NB: ImageJ's 32-bit type is float32, not uint32.
-            jc.ImagePlus.GRAY32: "float32",
-        }
-        for t in imagej_types:
-            if imagej_type == t:
-                return np.dtype(imagej_types[t])
-        raise TypeError(f"Unsupported original ImageJ type: {imagej_type}")
+        imagej_types = _imageplus_dtypes()
+        if imagej_type not in imagej_types:
+            raise TypeError(f"Unsupported original ImageJ type: {imagej_type}")
+        return imagej_types[imagej_type]
 
     raise TypeError("Unsupported Java type: " + str(sj.jclass(image_or_type).getName()))
+
+
+@lru_cache(maxsize=None)
+def _imglib2_type_dtype(class_name: str) -> Optional[np.dtype]:
+    """
+    Get the dtype of the ImgLib2 type with the given class name, or None if
+    the type is unsupported. Subclasses of the known types are resolved by
+    walking the known types once, and cached thereafter.
+    """
+    if class_name in _imglib2_types:
+        return np.dtype(_imglib2_types[class_name])
+    jclass = sj.jimport(class_name)
+    for c in _imglib2_types:
+        if issubclass(jclass, sj.jimport(c)):
+            return np.dtype(_imglib2_types[c])
+    return None
+
+
+@lru_cache(maxsize=None)
+def _imageplus_dtypes() -> dict:
+    """Get the dtypes of the original ImageJ image types."""
+    return {
+        int(jc.ImagePlus.GRAY8): np.dtype("uint8"),
+        int(jc.ImagePlus.GRAY16): np.dtype("uint16"),
+        # NB: ImageJ's 32-bit type is float32, not uint32.
+        int(jc.ImagePlus.GRAY32): np.dtype("float32"),
+    }
+
+
+def _pixel_dtype(dtype: np.dtype) -> np.dtype:
+    """Get the dtype holding pixel values of the given dtype as read from Java."""
+    if dtype.kind == "f":
+        return np.dtype("float64")
+    if dtype.kind == "b":
+        return np.dtype("bool")
+    # NB: Java longs are signed; unsigned 64-bit values are reinterpreted.
+    return np.dtype("int64")
+
+
+def _pixel_getter(dtype: np.dtype):
+    """Get a function reading the value of an ImgLib2 type of the given dtype."""
+    if dtype.kind == "f":
+        return lambda t: t.getRealDouble()
+    if dtype.kind == "b":
+        return lambda t: t.get()
+    return lambda t: t.getIntegerLong()
+
+
+def _pixel_setter(dtype: np.dtype):
+    """Get a function writing the value of an ImgLib2 type of the given dtype."""
+    if dtype.kind == "f":
+        return lambda t, value: t.setReal(value)
+    if dtype.kind == "b":
+        return lambda t, value: t.set(value)
+    return lambda t, value: t.setInteger(JLong(value))
+
+
+def _access_to_ndarray(
+    access, dtype: np.dtype, size: int, copy: bool = True
+) -> Optional[np.ndarray]:
+    """
+    Obtain a flat NumPy ndarray from an ImgLib2 ArrayDataAccess.
+
+    Direct NIO buffers in native byte order are wrapped without copying;
+    Java primitive arrays are transferred in bulk via the buffer protocol.
+
+    :param access: The ArrayDataAccess backing (part of) an image.
+    :param dtype: The NumPy dtype matching the image's ImgLib2 type.
+    :param size: The number of elements to take from the storage.
+    :param copy: If False, return None rather than copying a primitive array.
+    :return: A flat NumPy ndarray, or None if the storage is not accessible.
+    """
+    try:
+        storage = access.getCurrentStorageArray()
+    except AttributeError:
+        return None
+    if isinstance(storage, jc.Buffer):
+        if not storage.isDirect() or storage.order() != jc.ByteOrder.nativeOrder():
+            return None
+        return np.frombuffer(memoryview(storage), dtype=dtype, count=size)
+    if not copy:
+        return None
+    # NB: Java primitive arrays are signed; reinterpret the bits as needed.
+    narr = np.array(storage)
+    if narr.dtype.itemsize != dtype.itemsize:
+        return None
+    return narr[:size].view(dtype)
+
+
+def _unwrap_img(rai: "jc.RandomAccessibleInterval") -> "jc.RandomAccessibleInterval":
+    """
+    Strip Dataset, ImgPlus and other pass-through wrappers
+    to reach the underlying image.
+
+    :param rai: The RandomAccessibleInterval.
+    :return: The innermost wrapped image, or rai itself if not a wrapper.
+    """
+    while True:
+        if isinstance(rai, jc.Dataset):
+            rai = rai.getImgPlus()
+        elif isinstance(rai, jc.ImgPlus):
+            rai = rai.getImg()
+        elif str(rai.getClass().getName()) in _transparent_wrappers and hasattr(
+            rai, "getSource"
+        ):
+            rai = rai.getSource()
+        else:
+            return rai
+
+
+class _RAIChunkReader:
+    """
+    Array-like view of a RandomAccessibleInterval, with reversed dimensions,
+    which copies only the requested region into a NumPy ndarray when indexed.
+    """
+
+    def __init__(
+        self,
+        ij: "jc.ImageJ",
+        rai: "jc.RandomAccessibleInterval",
+        threads: Optional[int] = 1,
+    ):
+        self._ij = ij
+        self._rai = rai
+        self._threads = threads
+        self.ndim = rai.numDimensions()
+        self.shape = tuple(rai.dimension(d) for d in range(self.ndim))[::-1]
+        self.dtype = dtype(rai)
+
+    def __getitem__(self, key) -> np.ndarray:
+        if not isinstance(key, tuple):
+            key = (key,)
+        key = key + (slice(None),) * (self.ndim - len(key))
+        bounds, steps, squeeze = [], [], []
+        for axis, (k, length) in enumerate(zip(key, self.shape)):
+            if isinstance(k, slice):
+                start, stop, step = k.indices(length)
+                if step < 0:
+                    start, stop = stop + 1, start + 1
+                stop = max(start, stop)
+            else:
+                start = k + length if k < 0 else k
+                stop, step = start + 1, 1
+                squeeze.append(axis)
+            bounds.append((start, stop))
+            steps.append(slice(None, None, step))
+
+        shape = tuple(stop - start for start, stop in bounds)
+        if 0 in shape:
+            narr = np.empty(shape, dtype=self.dtype)
+        else:
+            # NB: RAI dimensions are reversed relative to the ndarray.
+            mins = [
+                self._rai.min(d) + start for d, (start, _) in enumerate(bounds[::-1])
+            ]
+            maxs = [
+                self._rai.min(d) + stop - 1 for d, (_, stop) in enumerate(bounds[::-1])
+            ]
+            chunk = jc.Views.interval(
+                self._rai, JArray(JLong)(mins), JArray(JLong)(maxs)
+            )
+            narr = np.empty(shape, dtype=self.dtype)
+            copy_rai_into_ndarray(
+                self._ij, jc.Views.zeroMin(chunk), narr, threads=self._threads
+            )
+        return narr[tuple(steps)].squeeze(axis=tuple(squeeze))
+
+
+def _slabs(rai: "jc.RandomAccessibleInterval", count: int) -> list:
+    """
+    Split a RandomAccessibleInterval into contiguous slabs along its slowest
+    dimension (the last RandomAccessibleInterval dimension).
+
+    :param rai: The RandomAccessibleInterval, of at least count pixels along
+        its slowest dimension.
+    :param count: The number of slabs.
+    :return: A list of (slab, start, stop) tuples: each slab as a zero-min view,
+        with its (zero-based) bounds along the slowest dimension.
+    """
+    ndim = rai.numDimensions()
+    d = ndim - 1
+    bounds = np.linspace(0, rai.dimension(d), count + 1).astype(int)
+    mins = [rai.min(i) for i in range(ndim)]
+    maxs = [rai.max(i) for i in range(ndim)]
+    slabs = []
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        slab_min, slab_max = list(mins), list(maxs)
+        slab_min[d], slab_max[d] = mins[d] + start, mins[d] + stop - 1
+        slab = jc.Views.interval(rai, JArray(JLong)(slab_min), JArray(JLong)(slab_max))
+        slabs.append((jc.Views.zeroMin(slab), int(start), int(stop)))
+    return slabs
+
+
+def _copy_executor(threads: int) -> ThreadPoolExecutor:
+    """
+    Get the thread pool for concurrent copies (and other work split into chunks
+    of an image), with at least the given number of threads. A single pool,
+    sized to the number of CPU cores, is shared by all copies, so that its
+    threads attach to the JVM only once; it is shut down when Python exits.
+    Each copy limits its own concurrency by the number of chunks it submits.
+    """
+    global _executor, _executor_threads
+    with _executor_lock:
+        if _executor is None or _executor_threads < threads:
+            if _executor is None:
+                atexit.register(_shutdown_copy_executor)
+            else:
+                # NB: Jobs already submitted to the old pool still complete.
+                _executor.shutdown(wait=False)
+            _executor_threads = max(threads, os.cpu_count() or 1)
+            _executor = ThreadPoolExecutor(
+                max_workers=_executor_threads, thread_name_prefix="pyimagej-copy"
+            )
+        return _executor
+
+
+def _shutdown_copy_executor() -> None:
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown()
+            _executor = None
+
+
+def _copy_with_imgutil(ij: "jc.ImageJ", rai, narr) -> None:
+    jc.ImgUtil.copy(rai, sj.to_java(narr))
+
+
+def _copy_with_images(ij: "jc.ImageJ", rai, narr) -> None:
+    jc.Images.copy(rai, sj.to_java(narr))
+
+
+def _copy_with_ops(ij: "jc.ImageJ", rai, narr) -> None:
+    ij.op().run("copy.rai", sj.to_java(narr), rai)
+
+
+# Functions implementing each copy_strategy.
+_copy_strategies = {
+    "ImgUtil.copy": _copy_with_imgutil,
+    "Images.copy": _copy_with_images,
+    "copy.rai": _copy_with_ops,
+}
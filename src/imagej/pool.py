@@ -0,0 +1,182 @@
+"""
+A pool of worker processes, each with its own warm ImageJ2 gateway.
+
+Since each Python process can host only a single JVM, processing images on
+several cores at once needs several processes. A Pool starts them once, and
+keeps their gateways running between jobs, so that each job only pays for its
+own processing rather than for imagej.init:
+
+.. highlight:: python
+.. code-block:: python
+
+    import imagej.pool
+
+    def denoise(ij, image):
+        return ij.py.from_java(ij.op().filter().gauss(ij.py.to_java(image), 2.0))
+
+    if __name__ == "__main__":
+        with imagej.pool.Pool(4, "sc.fiji:fiji") as pool:
+            results = pool.map(denoise, images)
+
+NumPy arrays passed to and returned from the workers are transferred through
+shared memory rather than pickled (except for results on Windows). Inputs which
+are SharedArrays already (see imagej.shm) are not copied at all; neither are
+SharedArray results, e.g. from imagej.shm.from_java, which the caller of map
+then owns and must unlink. The worker function must be picklable, i.e. defined
+at the top level of a module.
+
+Requires Python 3.8 or later.
+"""
+import collections
+import multiprocessing
+import sys
+from typing import Any, Callable, Iterable, Iterator, NamedTuple, Optional
+
+import numpy as np
+
+from imagej.shm import SharedArray
+
+# The gateway of a worker process.
+_gateway = None
+
+
+class Pool:
+    """
+    A pool of worker processes, each running an ImageJ2 gateway.
+
+    :param processes: The number of worker processes,
+        or None for one per CPU core.
+    :param args: Positional arguments to imagej.init in each worker.
+    :param kwargs: Keyword arguments to imagej.init in each worker.
+    """
+
+    def __init__(self, processes: Optional[int] = None, *args, **kwargs):
+        # NB: Forking a process with a running JVM is unsafe; always spawn.
+        context = multiprocessing.get_context("spawn")
+        self._processes = processes or multiprocessing.cpu_count()
+        self._pool = context.Pool(
+            self._processes, initializer=_init_worker, initargs=(args, kwargs)
+        )
+
+    def map(self, fn: Callable[[Any, Any], Any], images: Iterable) -> list:
+        """
+        Apply a function to each of the given images in the worker processes.
+
+        :param fn: A function taking a worker's ImageJ2 gateway and an image,
+            and returning a result. NumPy arrays are passed and returned via
+            shared memory, other values via pickling. Inputs which are
+            SharedArrays are passed to the function as NumPy views of their
+            shared memory.
+        :param images: The images (or other inputs) to process.
+        :return: The list of results, in the order of the images.
+        """
+        return list(self.imap(fn, images))
+
+    def imap(self, fn: Callable[[Any, Any], Any], images: Iterable) -> Iterator:
+        """
+        Lazy version of map, yielding the results in order as they complete.
+        Only a few images per worker are in flight at any time, so the images
+        may come from a generator too large to hold in memory at once.
+        """
+        pending = collections.deque()
+        try:
+            for image in images:
+                if len(pending) >= 2 * self._processes:
+                    yield _collect(*pending.popleft())
+                pending.append(self._submit(fn, image))
+            while pending:
+                yield _collect(*pending.popleft())
+        finally:
+            # NB: If a job fails (or the caller stops early), the inputs of the
+            # jobs not collected yet would otherwise leak their shared memory.
+            for _, shared in pending:
+                if shared is not None:
+                    shared.unlink()
+                    shared.close()
+
+    def close(self) -> None:
+        """Stop accepting jobs; the workers exit once their jobs are done."""
+        self._pool.close()
+
+    def terminate(self) -> None:
+        """Stop the worker processes immediately."""
+        self._pool.terminate()
+
+    def join(self) -> None:
+        """Wait for the worker processes to exit; see close and terminate."""
+        self._pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.terminate()
+        self.join()
+
+    def _submit(self, fn, image):
+        shared = None
+        if isinstance(image, np.ndarray):
+            image = shared = SharedArray.copy_of(image)
+        return self._pool.apply_async(_run, (fn, image)), shared
+
+
+class _SharedResult(NamedTuple):
+    """An ndarray result of a worker, to be copied out of shared memory."""
+
+    shared: SharedArray
+
+
+def _collect(async_result, shared):
+    """Wait for a job of the pool, and obtain its result."""
+    try:
+        result = async_result.get()
+    finally:
+        if shared is not None:
+            shared.unlink()
+            shared.close()
+    if isinstance(result, _SharedResult):
+        # NB: The worker hands its block over, to be unlinked once copied.
+        result.shared._owner = True
+        with result.shared as shared_result:
+            return shared_result.array.copy()
+    if isinstance(result, SharedArray):
+        # NB: The worker hands its block over to the caller.
+        result._owner = True
+    return result
+
+
+def _init_worker(args, kwargs) -> None:
+    import imagej
+
+    global _gateway
+    _gateway = imagej.init(*args, **kwargs)
+
+
+def _run(fn, image):
+    """Run a job in a worker process."""
+    shared = None
+    if isinstance(image, SharedArray):
+        shared, image = image, image.array
+    try:
+        result = fn(_gateway, image)
+    except Exception as e:
+        # NB: Java exceptions cannot be pickled back to the parent process.
+        import scyjava as sj
+
+        if sj.isjava(e):
+            raise RuntimeError(sj.jstacktrace(e) or str(e)) from None
+        raise
+    finally:
+        del image
+        if shared is not None:
+            shared.close()
+    if sys.platform == "win32":
+        # NB: On Windows, a shared memory block vanishes with its last handle,
+        # so results cannot outlive the worker's handle; pickle them instead.
+        if isinstance(result, SharedArray):
+            with result:
+                return result.array.copy()
+        return result
+    if isinstance(result, np.ndarray):
+        return _SharedResult(SharedArray.copy_of(result))
+    return result
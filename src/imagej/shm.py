@@ -0,0 +1,174 @@
+"""
+Transport of NumPy images between Python processes via shared memory.
+
+A SharedArray is a NumPy array living in a named shared memory block. Pickling
+a SharedArray transfers only the name of its block, so the receiving process
+(e.g. a worker of an imagej.pool.Pool) attaches to the same memory rather than
+receiving a copy. Converting a SharedArray with ij.py.to_java wraps the block
+via imglyb without copying too, so one stack in shared memory can be processed
+by the JVMs of several processes at once:
+
+.. highlight:: python
+.. code-block:: python
+
+    import imagej.shm
+
+    with imagej.shm.SharedArray.copy_of(narr) as shared:
+        img = ij.py.to_java(shared)  # backed by the shared memory block
+
+The process which created a SharedArray owns its block, and must unlink it
+once no process needs it anymore (leaving the with block does so). On Windows,
+a block is destroyed once the last process closes it, so its creator must keep
+it open until the other processes have attached to it.
+
+Requires Python 3.8 or later.
+"""
+import logging
+from functools import lru_cache
+from typing import Optional, Sequence
+
+import numpy as np
+
+import imagej.images as images
+from imagej._java import jc
+
+_logger = logging.getLogger(__name__)
+
+
+class SharedArray:
+    """
+    A NumPy array in a named shared memory block.
+
+    :param shape: The shape of the array.
+    :param dtype: The dtype of the array.
+    :param name: The name of an existing shared memory block to attach to,
+        or None to create a new (zero-filled) block.
+    """
+
+    def __init__(self, shape: Sequence[int], dtype, name: Optional[str] = None):
+        SharedMemory = _shared_memory_class()
+        self.shape = tuple(int(d) for d in shape)
+        self.dtype = np.dtype(dtype)
+        self._owner = name is None
+        if self._owner:
+            size = int(np.prod(self.shape)) * self.dtype.itemsize
+            # NB: Shared memory blocks cannot be empty.
+            self._shm = SharedMemory(create=True, size=max(1, size))
+        else:
+            self._shm = SharedMemory(name=name)
+        self._name = self._shm.name
+        # NB: Unlike np.ndarray(buffer=...), np.frombuffer holds on to the
+        # buffer, keeping the block mapped while any view of it is referenced.
+        count = int(np.prod(self.shape))
+        narr = np.frombuffer(self._shm.buf, self.dtype, count=count)
+        self.array = narr.reshape(self.shape)
+
+    @classmethod
+    def copy_of(cls, narr) -> "SharedArray":
+        """
+        Copy an array into a new SharedArray.
+
+        :param narr: The NumPy ndarray (or other arraylike) to copy.
+        :return: The new SharedArray, owning its block.
+        """
+        narr = np.asarray(narr)
+        shared = cls(narr.shape, narr.dtype)
+        shared.array[...] = narr
+        return shared
+
+    @property
+    def name(self) -> str:
+        """The name of the shared memory block."""
+        return self._name
+
+    @property
+    def ndim(self) -> int:
+        return len(self.shape)
+
+    def __array__(self, dtype=None, copy=None):
+        if dtype is None and not copy:
+            return self.array
+        return np.array(self.array, dtype=dtype, copy=True)
+
+    def __reduce__(self):
+        # NB: Pickle the name only; unpickling attaches to the same block.
+        return SharedArray, (self.shape, self.dtype.str, self.name)
+
+    def __repr__(self):
+        return (
+            f"SharedArray(shape={self.shape}, dtype={self.dtype}, name={self.name!r})"
+        )
+
+    def close(self) -> None:
+        """
+        Close this process's access to the block. Arrays and Java images still
+        referencing the block keep it mapped until they are garbage collected.
+        """
+        if getattr(self, "_shm", None) is None:
+            return
+        self.array = None
+        try:
+            self._shm.close()
+        except BufferError:
+            # NB: The block is still in use (e.g. wrapped by a Java image);
+            # it is unmapped once it is no longer referenced.
+            _logger.debug("Shared memory block %s is still in use", self.name)
+        self._shm = None
+
+    def unlink(self) -> None:
+        """
+        Destroy the block once all processes have closed it. Processes which
+        are attached to it already can keep using it until then.
+        """
+        # NB: The block can be unlinked by name even after it was closed.
+        _shared_memory_class()(name=self.name).unlink()
+        self._owner = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._owner:
+            self.unlink()
+        self.close()
+
+    def __del__(self):
+        self.close()
+
+
+def from_java(ij: "jc.ImageJ", image, threads: Optional[int] = 1) -> SharedArray:
+    """
+    Copy a Java image into a new SharedArray, with one copy straight into the
+    shared memory block. As with ij.py.from_java, the dimensions of the
+    SharedArray are reversed relative to the Java image.
+
+    :param ij: The ImageJ2 gateway (see imagej.init)
+    :param image: The RandomAccessibleInterval (e.g. Img or Dataset) to copy.
+    :param threads: The number of threads to copy the image data with.
+    :return: The new SharedArray, owning its block.
+    """
+    if not isinstance(image, jc.RandomAccessibleInterval):
+        raise TypeError(f"Unsupported image type: {type(image)}")
+    try:
+        dtype = images.dtype(image)
+    except TypeError:
+        dtype = np.dtype("float64")
+    shared = SharedArray(tuple(reversed(image.shape)), dtype)
+    images.copy_rai_into_ndarray(ij, image, shared.array, threads=threads)
+    return shared
+
+
+@lru_cache(maxsize=None)
+def _shared_memory_class():
+    # NB: multiprocessing.shared_memory requires Python 3.8+; import on demand.
+    from multiprocessing import shared_memory
+
+    class _SharedMemory(shared_memory.SharedMemory):
+        def __del__(self):
+            try:
+                self.close()
+            except (BufferError, OSError):
+                # NB: Still mapped by an array; unmapped along with it.
+                pass
+
+    return _SharedMemory
@@ -1,10 +1,14 @@
 """
 Utility functions for manipulating image stacks.
 """
-from typing import List, Tuple
+from typing import Iterator, List, Optional, Tuple
 
+import numpy as np
 import scyjava as sj
 
+import imagej.images as images
+from imagej._java import jc
+
 
 def rai_slice(rai, imin: Tuple, imax: Tuple, istep: Tuple):
     """Slice ImgLib2 images.
@@ -53,6 +57,38 @@ def rai_slice(rai, imin: Tuple, imax: Tuple, istep: Tuple):
     return dimension_reduced
 
 
+def iter_hyperslices(
+    ij: "jc.ImageJ",
+    rai: "jc.RandomAccessibleInterval",
+    d: int,
+    reuse_buffer: bool = False,
+    threads: Optional[int] = 1,
+) -> Iterator[np.ndarray]:
+    """Iterate over the hyperslices of an ImgLib2 image along one dimension.
+
+    Each hyperslice is obtained with Views.hyperSlice and copied into a NumPy
+    ndarray, one at a time, so only a single hyperslice is held in memory
+    at once. As with copy_rai_into_ndarray, each ndarray has reversed
+    dimensions relative to the hyperslice.
+
+    :param ij: The ImageJ2 gateway (see imagej.init)
+    :param rai: An ImgLib2 RandomAccessibleInterval
+    :param d: The dimension of the RandomAccessibleInterval to slice along.
+    :param reuse_buffer: If True, copy every hyperslice into the same ndarray,
+        which is then overwritten on each iteration.
+    :param threads: The number of threads to copy each hyperslice with,
+        or None for one thread per CPU core.
+    :return: A generator of NumPy ndarrays, one per position along d.
+    """
+    buffer = None
+    for position in range(rai.min(d), rai.max(d) + 1):
+        hyperslice = jc.Views.hyperSlice(rai, d, position)
+        if buffer is None or not reuse_buffer:
+            buffer = images.create_ndarray(hyperslice)
+        images.copy_rai_into_ndarray(ij, hyperslice, buffer, threads=threads)
+        yield buffer
+
+
 def _index_within_range(query: List[int], source: List[int]) -> bool:
     """Check if query is within range of source index.
     :param query: List of query int
@@ -0,0 +1,66 @@
+import imagej._classpath as _classpath
+
+# -- Tests --
+
+
+def test_classpath_cache_round_trip(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    jar = tmp_path / "foo.jar"
+    jar.touch()
+    key = _classpath.cache_key("2.14.0", "headless", True, [])
+    assert _classpath.load(key) is None
+
+    _classpath.save(key, [str(jar)], ["-Djava.awt.headless=true"])
+    entry = _classpath.load(key)
+    assert entry["classpath"] == [str(jar)]
+    assert entry["options"] == ["-Djava.awt.headless=true"]
+    assert _classpath.load(_classpath.cache_key("2.14.0", "gui", True, [])) is None
+
+    # entries can be deleted one at a time
+    other_key = _classpath.cache_key("2.15.0", "headless", True, [])
+    _classpath.save(other_key, [str(jar)], [])
+    _classpath.clear_cache(other_key)
+    assert _classpath.load(other_key) is None
+    assert _classpath.load(key) is not None
+
+    _classpath.clear_cache()
+    assert _classpath.load(key) is None
+
+
+def test_classpath_cache_invalidation(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    jars_dir = tmp_path / "Fiji.app" / "jars"
+    jars_dir.mkdir(parents=True)
+    jar = jars_dir / "foo.jar"
+    jar.touch()
+    key = _classpath.cache_key(str(tmp_path / "Fiji.app"), "headless", False, [])
+
+    _classpath.save(key, [str(jar)], [], [str(jars_dir)])
+    assert _classpath.load(key) is not None
+
+    # a new JAR modifies the watched directory
+    (jars_dir / "bar.jar").touch()
+    assert _classpath.load(key) is None
+
+    # a missing JAR invalidates the entry
+    _classpath.save(key, [str(jar)], [], [str(jars_dir)])
+    jar.unlink()
+    assert _classpath.load(key) is None
+
+
+def test_bundle_round_trip(tmp_path):
+    jars = []
+    for subdir in ("a", "b"):
+        (tmp_path / subdir).mkdir()
+        jar = tmp_path / subdir / "foo.jar"
+        jar.write_bytes(subdir.encode())
+        jars.append(str(jar))
+    bundle_dir = tmp_path / "bundle"
+    assert _classpath.load_bundle(str(bundle_dir)) is None
+
+    num_jars = _classpath.write_bundle(str(bundle_dir), jars, {"endpoint": "2.14.0"})
+    assert num_jars == 2
+    bundled = _classpath.load_bundle(str(bundle_dir))
+    assert len(bundled) == 2
+    # classpath order is kept, and same-named JARs do not clobber each other
+    assert [open(jar, "rb").read() for jar in bundled] == [b"a", b"b"]
@@ -0,0 +1,138 @@
+import bisect
+
+import pytest
+import scyjava as sj
+from scyjava._convert import _convert
+
+import imagej.convert as convert
+
+# -- Tests --
+
+
+def test_converter_cache_memoizes_by_type():
+    calls = []
+
+    def is_str(obj):
+        calls.append(obj)
+        return isinstance(obj, str)
+
+    converters = convert._ConverterCache(sj.Priority.HIGH)
+    converters.add(
+        sj.Converter(
+            predicate=lambda obj: isinstance(obj, str),
+            converter=lambda obj, **hints: hints.get("prefix", "") + obj,
+            priority=sj.Priority.HIGH,
+        )
+    )
+    converters.add(
+        sj.Converter(predicate=is_str, converter=str.upper, priority=sj.Priority.HIGH)
+    )
+    # as in scyjava, the last added converter of equal priority wins
+    assert converters.convert("a") == "A"
+    assert converters.convert("b") == "B"
+    assert not converters.supports(1)
+    assert not converters.supports(2)
+    # the predicate is evaluated once per type at most
+    assert calls == ["a", 1]
+
+    # adding a converter invalidates the memoized choices
+    converters.add(
+        sj.Converter(
+            predicate=lambda obj: isinstance(obj, int),
+            converter=lambda obj: obj + 1,
+            priority=sj.Priority.HIGH,
+        )
+    )
+    assert converters.supports(1)
+    assert converters.convert(1) == 2
+
+    with pytest.raises(ValueError):
+        converters.add(
+            sj.Converter(predicate=is_str, converter=str, priority=sj.Priority.LOW)
+        )
+
+
+def test_converter_cache_evaluates_per_object_predicates():
+    converters = convert._ConverterCache(sj.Priority.HIGH)
+    converters.add(
+        sj.Converter(
+            predicate=lambda obj: isinstance(obj, int),
+            converter=lambda obj: "int",
+            priority=sj.Priority.HIGH,
+        )
+    )
+    converters.add(
+        sj.Converter(
+            predicate=lambda obj: obj > 0,
+            converter=lambda obj: "positive",
+            priority=sj.Priority.HIGH,
+        ),
+        by_type=False,
+    )
+    assert converters.convert(1) == "positive"
+    assert converters.convert(-1) == "int"
+    assert converters.convert(2) == "positive"
+
+
+def test_converter_cache_evaluates_per_object_predicates_once():
+    calls = []
+
+    def is_positive(obj):
+        calls.append(obj)
+        return obj > 0
+
+    converters = convert._ConverterCache(sj.Priority.HIGH)
+    converters.add(
+        sj.Converter(
+            predicate=is_positive,
+            converter=lambda obj: "positive",
+            priority=sj.Priority.HIGH,
+        ),
+        by_type=False,
+        type_check=lambda obj: isinstance(obj, int),
+    )
+    # as scyjava does: supports, then convert
+    assert converters.supports(3)
+    assert converters.convert(3) == "positive"
+    assert calls == [3]
+    # objects of other types are rejected by the type check alone
+    assert not converters.supports(3.0)
+    assert not converters.supports("a")
+    assert calls == [3]
+
+
+def test_converter_groups_keep_priorities():
+    registered = []
+    converters = convert._ConverterGroups()
+    for priority, cls in ((sj.Priority.HIGH + 1, str), (sj.Priority.HIGH - 2, int)):
+        converters.add(
+            sj.Converter(
+                predicate=lambda obj, cls=cls: isinstance(obj, cls),
+                converter=lambda obj: "imagej",
+                priority=priority,
+            )
+        )
+    converters.register(lambda converter: bisect.insort(registered, converter))
+    # converters of other libraries rank between the groups, as before
+    bisect.insort(
+        registered,
+        sj.Converter(
+            predicate=lambda obj: isinstance(obj, (str, int)),
+            converter=lambda obj: "other",
+            priority=sj.Priority.HIGH,
+        ),
+    )
+    assert [c.priority for c in registered] == [
+        sj.Priority.HIGH - 2,
+        sj.Priority.HIGH,
+        sj.Priority.HIGH + 1,
+    ]
+    assert _convert("a", registered) == "imagej"
+    assert _convert(1, registered) == "other"
+
+
+def test_table_converter_wins(ij_fixture):
+    pd = pytest.importorskip("pandas")
+    DefaultGenericTable = sj.jimport("org.scijava.table.DefaultGenericTable")
+    table = DefaultGenericTable(2, 3)
+    assert isinstance(ij_fixture.py.from_java(table), pd.DataFrame)
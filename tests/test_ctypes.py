@@ -1,8 +1,11 @@
 import ctypes
 
+import numpy as np
 import pytest
 import scyjava as sj
 
+import imagej.convert as convert
+
 parameters = [
     (ctypes.c_bool, "net.imglib2.type.logic.BoolType", True),
     (ctypes.c_byte, "net.imglib2.type.numeric.integer.ByteType", 4),
@@ -40,3 +43,25 @@ def test_ctype_to_realtype(ij_fixture, ctype, jtype_str, value):
     converted_back = ij_fixture.py.from_java(converted)
     assert isinstance(converted_back, ctype)
     assert converted_back.value == value
+
+
+@pytest.mark.parametrize(argnames="ctype,jtype_str,value", argvalues=parameters)
+def test_ndarray_to_realtypes(ij_fixture, ctype, jtype_str, value):
+    narr = np.array([value, value, 0], dtype=np.dtype(ctype))
+    img = convert.ndarray_to_realtypes(narr)
+    assert list(img.shape) == [3]
+    assert img.firstElement().get() == value
+    # Convert a list of RealTypes back into an ndarray
+    jtype = sj.jimport(jtype_str)
+    realtypes = sj.to_java([ij_fixture.py.to_java(ctype(v)) for v in narr])
+    assert all(isinstance(t, jtype) for t in realtypes)
+    converted_back = convert.realtypes_to_ndarray(ij_fixture, realtypes)
+    assert converted_back.dtype == narr.dtype
+    assert np.array_equal(converted_back, narr)
+    assert np.array_equal(convert.realtypes_to_ndarray(ij_fixture, img), narr)
+
+
+def test_empty_realtypes_to_ndarray(ij_fixture):
+    ArrayList = sj.jimport("java.util.ArrayList")
+    with pytest.raises(ValueError):
+        convert.realtypes_to_ndarray(ij_fixture, ArrayList())
@@ -341,6 +341,104 @@ def test_img_converts_to_ndarray(ij_fixture):
     convert_img_and_assert_equality(ij_fixture, get_img(ij_fixture))
 
 
+@pytest.mark.parametrize(
+    argnames="factory",
+    argvalues=["net.imglib2.img.array.ArrayImgs", "net.imglib2.img.planar.PlanarImgs"],
+)
+def test_primitive_storage_converts_to_ndarray(ij_fixture, factory):
+    Imgs = sj.jimport(factory)
+    img = Imgs.unsignedShorts(4, 3, 2)
+    cursor = img.cursor()
+    value = 60000
+    while cursor.hasNext():
+        cursor.next().set(value)
+        value += 11
+    assert images.ndarray_from_storage(img) is not None
+    narr = ij_fixture.py.from_java(img)
+    assert narr.dtype == np.uint16
+    assert narr.shape == (2, 3, 4)
+    assert_ndarray_equal_to_img(img, narr)
+
+
+def test_imglyb_storage_converts_to_ndarray_view(ij_fixture):
+    nparr = get_nparr()
+    img = ij_fixture.py.to_java(nparr)
+    narr = images.ndarray_from_storage(img)
+    assert narr is not None
+    assert np.shares_memory(narr, nparr)
+    assert_ndarray_equal_to_ndarray(narr, nparr)
+
+
+def test_copy_strategy_is_resolved_once(ij_fixture):
+    strategy = images.copy_strategy()
+    assert strategy in ("ImgUtil.copy", "Images.copy", "copy.rai")
+    assert images.copy_strategy() is strategy
+    img = get_img(ij_fixture)
+    narr = images.create_ndarray(img)
+    images.copy_rai_into_ndarray(ij_fixture, img, narr)
+    assert_ndarray_equal_to_img(img, narr)
+
+
+@pytest.mark.parametrize(argnames="threads", argvalues=[2, 3, None])
+def test_multithreaded_copy(ij_fixture, threads):
+    Views = sj.jimport("net.imglib2.view.Views")
+    img = Views.translate(get_img(ij_fixture), 3, -1, 0, 2, 5)
+    narr = ij_fixture.py.initialize_numpy_image(img)
+    ij_fixture.py.rai_to_numpy(img, narr, threads=threads)
+    assert_ndarray_equal_to_img(Views.zeroMin(img), narr)
+
+
+def test_copy_executor_is_shared():
+    executor = images._copy_executor(4)
+    assert images._copy_executor(2) is executor
+    assert images._copy_executor(3) is executor
+
+
+def test_multithreaded_from_java(ij_fixture):
+    xarr = get_xarr()
+    dataset = ij_fixture.py.to_java(xarr)
+    invert_xarr = ij_fixture.py.from_java(dataset, threads=4)
+    assert (xarr.values == invert_xarr.values).all()
+    assert list(xarr.dims) == list(invert_xarr.dims)
+
+
+@pytest.mark.parametrize(argnames="reuse_buffer", argvalues=[False, True])
+def test_iter_planes(ij_fixture, reuse_buffer):
+    xarr = get_xarr()
+    dataset = ij_fixture.py.to_java(xarr)
+    invert_xarr = ij_fixture.py.from_java(dataset)
+    java_dims = [dims._to_pydim(str(ax.type().getLabel())) for ax in dataset.dim_axes]
+    plane_dims = [d for d in reversed(java_dims) if d != "pln"]
+    planes = ij_fixture.py.iter_planes(dataset, "pln", reuse_buffer=reuse_buffer)
+    count = 0
+    for i, plane in enumerate(planes):
+        expected = invert_xarr.isel(pln=i).transpose(*plane_dims).values
+        assert plane.shape == expected.shape
+        assert (plane == expected).all()
+        count += 1
+    assert count == xarr.sizes["pln"]
+
+
+def test_lazy_from_java(ij_fixture):
+    da = pytest.importorskip("dask.array")
+    xarr = get_xarr()
+    dataset = ij_fixture.py.to_java(xarr)
+    lazy_xarr = ij_fixture.py.from_java(dataset, lazy=True)
+    assert isinstance(lazy_xarr.data, da.Array)
+    assert list(xarr.dims) == list(lazy_xarr.dims)
+    for dim in xarr.dims:
+        assert np.allclose(xarr.coords[dim], lazy_xarr.coords[dim])
+    assert (xarr.values == lazy_xarr.values).all()
+    assert (xarr.isel(t=1, ch=2).values == lazy_xarr.isel(t=1, ch=2).values).all()
+    # chunks span whole planes, with all channels
+    plane_dims = ("row", "col", "ch")
+    expected_chunks = tuple(
+        (xarr.sizes[d],) if d in plane_dims else (1,) * xarr.sizes[d]
+        for d in lazy_xarr.dims
+    )
+    assert lazy_xarr.data.chunks == expected_chunks
+
+
 def test_cstyle_array_with_labeled_dims_converts(ij_fixture):
     xarr = get_xarr()
     assert_xarray_equal_to_dataset(ij_fixture, xarr, ij_fixture.py.to_java(xarr))
@@ -424,6 +522,49 @@ def test_rgb_image_maintains_correct_dim_order_on_conversion(ij_fixture):
     assert_inverted_xarr_equal_to_xarr(dataset, ij_fixture, xarr)
 
 
+def test_channel_last_xarr_conversion_shares_memory(ij_fixture):
+    xarr = get_xarr()
+    dataset = ij_fixture.py.to_java(xarr)
+    xarr.values[2, 1, 3, 4, 1] = 42
+    ra = dataset.randomAccess()
+    for d, position in enumerate([4, 3, 1, 2, 1]):
+        ra.setPosition(position, d)
+    assert ra.get().getRealDouble() == 42
+    # read-only data cannot be written via the Java image
+    xarr.values.flags.writeable = False
+    dataset = ij_fixture.py.to_java(xarr)
+    ra = dataset.randomAccess()
+    for d, position in enumerate([4, 3, 1, 2, 1]):
+        ra.setPosition(position, d)
+    ra.get().setReal(7)
+    assert xarr.values[2, 1, 3, 4, 1] == 42
+
+
+def test_chunked_xarr_conversion_is_lazy(ij_fixture):
+    da = pytest.importorskip("dask.array")
+    narr = np.arange(4 * 6 * 5 * 3, dtype=np.uint16).reshape(4, 6, 5, 3)
+    computed = []
+
+    def compute(block, block_info=None):
+        if block_info:
+            computed.append(block_info[None]["chunk-location"])
+        return block
+
+    data = da.from_array(narr, chunks=(1, 6, 5, 3)).map_blocks(
+        compute, meta=np.empty((0, 0, 0, 0), dtype=narr.dtype)
+    )
+    xarr = xr.DataArray(data, dims=["t", "y", "x", "c"])
+    dataset = ij_fixture.py.to_java(xarr)
+    assert computed == []
+    assert list(dataset.dimensionsAsLongArray()) == [5, 6, 4, 3]
+    ra = dataset.randomAccess()
+    for d, position in enumerate([4, 3, 2, 1]):
+        ra.setPosition(position, d)
+    assert ra.get().getRealDouble() == narr[2, 3, 4, 1]
+    # only the chunk holding the pixel was computed
+    assert computed == [(2, 0, 0, 0)]
+
+
 def test_no_coords_or_dims_in_xarr(ij_fixture):
     xarr = get_xarr("NoDims")
     dataset = ij_fixture.py.from_java(xarr)
@@ -449,6 +590,76 @@ def test_non_linear_coord_on_xarr_conversion(ij_fixture):
     assert isinstance(axes[-1], jc.DefaultLinearAxis)
 
 
+def test_non_linear_axes_are_not_shared_between_conversions(ij_fixture):
+    System = sj.jimport("java.lang.System")
+    xarr = get_non_linear_coord_xarr()
+    axes1 = ij_fixture.py.to_java(xarr).dim_axes
+    axes2 = ij_fixture.py.to_java(xarr).dim_axes
+    for i in range(2):
+        assert isinstance(axes2[i], jc.EnumeratedAxis)
+        # each image must get its own axis, even when the coordinates match
+        assert System.identityHashCode(axes1[i]) != System.identityHashCode(axes2[i])
+        for position in range(30):
+            assert axes1[i].calibratedValue(position) == pytest.approx(
+                xarr.coords[xarr.dims[1 - i]][position]
+            )
+            assert axes2[i].calibratedValue(position) == axes1[i].calibratedValue(
+                position
+            )
+
+
+def test_axes_coords_match_calibrated_values(ij_fixture):
+    xarr = get_non_linear_coord_xarr()
+    dataset = ij_fixture.py.to_java(xarr)
+    axes = list(dataset.dim_axes)
+    coords = dims._get_axes_coords(axes, list(dataset.dims), dataset.shape)
+    for axis, length, dim in zip(axes, dataset.shape, dataset.dims):
+        assert isinstance(coords[dim], np.ndarray)
+        expected = [axis.calibratedValue(position) for position in range(length)]
+        assert coords[dim].tolist() == expected
+
+
+def test_enumerated_axis_coords_without_reflection(ij_fixture, monkeypatch):
+    xarr = get_non_linear_coord_xarr()
+    axes = list(ij_fixture.py.to_java(xarr).dim_axes)
+    expected = [dims._get_axis_coords(axis, 30).tolist() for axis in axes[:2]]
+    # without access to the values field, the public API is used instead
+    monkeypatch.setattr(dims, "_enumerated_axis_values_field", lambda: None)
+    for axis, values in zip(axes[:2], expected):
+        assert dims._get_axis_coords(axis, 30).tolist() == values
+
+
+def test_dtype_of_imglib2_types(ij_fixture):
+    for class_name, dtype in images._imglib2_types.items():
+        if "LongAccess" in class_name:
+            continue
+        realtype = sj.jimport(class_name)()
+        assert images.dtype(realtype) == np.dtype(dtype)
+        # subsequent lookups hit the memoized table
+        assert images.dtype(realtype) == np.dtype(dtype)
+    assert images._imglib2_type_dtype("java.lang.Object") is None
+
+
+def test_memmap_conversion(ij_fixture, tmp_path):
+    narr = np.arange(60, dtype=np.uint16).reshape(3, 4, 5)
+    path = tmp_path / "image.npy"
+    np.save(path, narr)
+    mmap = images.open_memmap(path)
+    dataset = ij_fixture.py.to_dataset(mmap)
+    assert list(dataset.shape) == [5, 4, 3]
+    assert_ndarray_equal_to_img(dataset, narr)
+    # writes to a read-only memory map are discarded rather than crashing
+    ij_fixture.py.to_java(mmap)[1, 2, 0].setReal(1000)
+    assert np.array_equal(mmap, narr)
+
+    raw_path = tmp_path / "image.raw"
+    narr.tofile(raw_path)
+    raw = images.open_memmap(raw_path, dtype=np.uint16, shape=(3, 4, 5), mode="r+")
+    img = ij_fixture.py.to_java(raw)
+    img[1, 2, 0].setReal(1000)
+    assert raw[0, 2, 1] == 1000
+
+
 def test_non_numeric_coord_on_xarr_conversion(ij_fixture):
     xarr = get_non_numeric_coord_xarr()
     dataset = ij_fixture.py.to_java(xarr)
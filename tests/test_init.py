@@ -0,0 +1,39 @@
+import scyjava as sj
+
+import imagej
+
+# -- Tests --
+
+
+def test_startup_profile(ij_fixture):
+    ij_fixture.legacy
+    profile = ij_fixture.py.startup_profile()
+    phases = [p["phase"] for p in profile]
+    assert "gateway" in phases
+    # optional phases are recorded once, when they happen
+    assert phases.count("legacy") == 1
+    assert phases.count("converters") == 1
+    for p in profile:
+        assert p["seconds"] >= 0
+        assert p["heap_used"] is None or p["heap_used"] > 0
+    # the profile is a copy
+    profile.clear()
+    assert ij_fixture.py.startup_profile()
+
+
+def test_minimal_services(ij_fixture):
+    # NB: The session gateway is only needed to start the JVM. Neither it nor
+    # the converters (which ij.py would register for the new gateway) are
+    # touched, so that disposing the new gateway cannot affect other tests.
+    ArrayImgs = sj.jimport("net.imglib2.img.array.ArrayImgs")
+    Service = sj.jimport("org.scijava.service.Service")
+    ij = imagej._create_gateway(services="minimal")
+    try:
+        assert ij.legacy is None
+        assert ij.op() is not None
+        assert ij.convert() is not None
+        assert ij.dataset().create(ArrayImgs.doubles(4, 3))
+        all_services = ij.plugin().getPluginsOfType(Service).size()
+        assert ij.context().getServiceIndex().size() < all_services
+    finally:
+        ij.dispose()
@@ -104,3 +104,9 @@ def test_py_java_py(ij_fixture, py_labeling):
     assert_labels_equality(
         vars(exp_labels), vars(act_labels), ["numSources", "indexImg"]
     )
+
+
+def test_conversion_leaves_no_files(ij_fixture, py_labeling, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    ij_fixture.py.from_java(ij_fixture.py.to_java(py_labeling))
+    assert list(tmp_path.iterdir()) == []
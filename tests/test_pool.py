@@ -0,0 +1,110 @@
+import os
+import pickle
+import sys
+
+import numpy as np
+import pytest
+
+import imagej.pool
+
+# -- Helpers --
+
+
+def _shared_memory_blocks():
+    return set(os.listdir("/dev/shm"))
+
+
+class _Done:
+    """A finished job, standing in for a multiprocessing AsyncResult."""
+
+    def __init__(self, result):
+        self._result = result
+
+    def get(self):
+        return self._result
+
+
+class _FailingPool:
+    """A multiprocessing pool standing in for one whose jobs all fail."""
+
+    def apply_async(self, fn, args):
+        return self
+
+    def get(self):
+        raise RuntimeError("Job failed")
+
+
+# -- Worker functions --
+
+
+def _round_trip(ij, image):
+    return ij.py.from_java(ij.py.to_java(image)) * 2
+
+
+def _double(ij, image):
+    return image * 2
+
+
+def _describe(ij, value):
+    return f"{value}: {ij.getVersion() is not None}"
+
+
+# -- Tests --
+
+
+@pytest.fixture(scope="module")
+def pool(request):
+    ij_dir = request.config.getoption("--ij")
+    legacy = request.config.getoption("--legacy")
+    with imagej.pool.Pool(2, ij_dir, add_legacy=legacy) as pool:
+        yield pool
+
+
+def test_pool_map(pool):
+    images = [np.full((4, 5), i, dtype=np.uint8) for i in range(5)]
+    results = pool.map(_round_trip, images)
+    assert len(results) == len(images)
+    for image, result in zip(images, results):
+        assert result.shape == image.shape
+        assert np.array_equal(result, image * 2)
+
+
+def test_pool_map_non_arrays(pool):
+    assert pool.map(_describe, ["a", "b"]) == ["a: True", "b: True"]
+
+
+@pytest.mark.skipif(
+    not sys.platform.startswith("linux"), reason="Shared memory blocks in /dev/shm"
+)
+def test_pool_map_unlinks_shared_memory(pool):
+    before = _shared_memory_blocks()
+    images = [np.full((4, 5), i, dtype=np.uint8) for i in range(3)]
+    pool.map(_round_trip, images)
+    assert _shared_memory_blocks() == before
+
+
+@pytest.mark.skipif(
+    not sys.platform.startswith("linux"), reason="Shared memory blocks in /dev/shm"
+)
+def test_collect_unlinks_shared_memory():
+    # NB: Runs a job in this process, pickling as the pool would.
+    before = _shared_memory_blocks()
+    shared = imagej.pool.SharedArray.copy_of(np.ones((4, 5)))
+    result = imagej.pool._run(_double, pickle.loads(pickle.dumps(shared)))
+    result = pickle.loads(pickle.dumps(result))
+    expected = shared.array * 2
+    assert np.array_equal(imagej.pool._collect(_Done(result), shared), expected)
+    assert _shared_memory_blocks() == before
+
+
+@pytest.mark.skipif(
+    not sys.platform.startswith("linux"), reason="Shared memory blocks in /dev/shm"
+)
+def test_imap_unlinks_pending_shared_memory():
+    before = _shared_memory_blocks()
+    pool = imagej.pool.Pool.__new__(imagej.pool.Pool)
+    pool._processes, pool._pool = 1, _FailingPool()
+    images = [np.full((4, 5), i, dtype=np.uint8) for i in range(4)]
+    with pytest.raises(RuntimeError):
+        pool.map(_double, images)
+    assert _shared_memory_blocks() == before
@@ -1,6 +1,8 @@
+import imglyb
 import numpy as np
 import pytest
 import scyjava as sj
+from jpype import JArray, JLong
 
 # -- Fixtures --
 
@@ -20,6 +22,15 @@ def img():
     return img
 
 
+# -- Helpers --
+
+
+def _to_ndarray(img):
+    # NB: In the dimension order of img[...] indexing, unlike ij.py.from_java.
+    shape = tuple(img.shape)
+    return np.array([img[index].get() for index in np.ndindex(*shape)]).reshape(shape)
+
+
 # -- Tests --
 
 
@@ -169,7 +180,9 @@ def test_transpose3d(img):
 
 
 def test_addition(img):
+    RandomAccessibleInterval = sj.jimport("net.imglib2.RandomAccessibleInterval")
     actual = img + img
+    assert isinstance(actual, RandomAccessibleInterval)
     expected = np.multiply(img, 2)
     for i in range(2):
         for j in range(3):
@@ -202,3 +215,162 @@ def test_division(img):
         for j in range(3):
             for k in range(4):
                 assert expected[i, j, k] == actual[i, j, k]
+
+
+def test_scalar_and_reflected_operands(img):
+    assert (_to_ndarray(img + 1) == _to_ndarray(img) + 1).all()
+    assert (_to_ndarray(100 - img) == 100 - _to_ndarray(img)).all()
+    assert (_to_ndarray(2 * img) == 2 * _to_ndarray(img)).all()
+
+
+def test_lazy_expression(img):
+    RandomAccessibleInterval = sj.jimport("net.imglib2.RandomAccessibleInterval")
+    expected = (2 * _to_ndarray(img) + _to_ndarray(img)) - 1
+    expr = (2 * img.lazy() + img) - 1
+    assert not isinstance(expr, RandomAccessibleInterval)
+    assert expr.shape == img.shape
+    result = expr.compute()
+    assert isinstance(result, RandomAccessibleInterval)
+    # the result is computed once
+    assert expr.compute() is result
+    assert (_to_ndarray(result) == expected).all()
+    # arithmetic with an expression stays lazy
+    assert not isinstance(img + img.lazy(), RandomAccessibleInterval)
+
+
+def test_imgplus_operands_keep_metadata(img):
+    Axes = sj.jimport("net.imagej.axis.Axes")
+    DefaultLinearAxis = sj.jimport("net.imagej.axis.DefaultLinearAxis")
+    ImgPlus = sj.jimport("net.imagej.ImgPlus")
+    axes = [
+        DefaultLinearAxis(Axes.X, 0.5),
+        DefaultLinearAxis(Axes.Y, 0.5),
+        DefaultLinearAxis(Axes.TIME, 2.0),
+    ]
+    a = ImgPlus(img, "a", *axes)
+    result = a + a
+    assert isinstance(result, ImgPlus)
+    assert result.getName() == "a"
+    for d, axis in enumerate(axes):
+        assert result.axis(d).type() == axis.type()
+        assert result.axis(d).calibratedValue(1) == axis.calibratedValue(1)
+    assert (_to_ndarray(result) == 2 * _to_ndarray(img)).all()
+
+
+def test_in_place(img):
+    expected = (_to_ndarray(img) + 1) * 2 - 3
+    original = img
+    img += 1
+    img *= 2
+    img -= 3
+    assert img is original
+    assert (_to_ndarray(img) == expected).all()
+    img /= img
+    assert (_to_ndarray(img) == 1).all()
+
+
+def test_reductions(img):
+    narr = _to_ndarray(img)
+    assert img.sum() == narr.sum()
+    assert img.mean() == narr.mean()
+    assert img.std() == pytest.approx(narr.std())
+    assert img.amin() == narr.min()
+    assert img.amax() == narr.max()
+    assert img.amax().dtype == np.int8
+    # per-plane statistics
+    assert (img.sum(axis=(0, 1)) == narr.sum(axis=(0, 1))).all()
+    assert (img.mean(axis=-1) == narr.mean(axis=-1)).all()
+    assert img.std(axis=0, ddof=1) == pytest.approx(narr.std(axis=0, ddof=1))
+    assert (img.amin(axis=(1, 2)) == narr.min(axis=(1, 2))).all()
+    assert img.amax(axis=1, keepdims=True).shape == (2, 1, 4)
+    # views
+    view = img[:, 1:, :]
+    assert view.sum() == narr[:, 1:, :].sum()
+    assert view.amin() == narr[:, 1:, :].min()
+    with pytest.raises(ValueError):
+        img.sum(axis=3)
+
+
+def test_std_of_large_values():
+    narr = 1e9 + (np.arange(1000) % 7) * 1e-3
+    rai = imglyb.to_imglib(narr)
+    assert rai.std() == pytest.approx(narr.std(), rel=1e-6)
+
+
+def test_histogram(img):
+    narr = _to_ndarray(img)
+    counts, edges = img.histogram(bins=4)
+    expected_counts, expected_edges = np.histogram(narr, bins=4)
+    assert counts.tolist() == expected_counts.tolist()
+    assert edges == pytest.approx(expected_edges)
+    counts, _ = img.histogram(bins=4, threads=3)
+    assert counts.tolist() == expected_counts.tolist()
+    counts, _ = img.histogram(bins=2, range=(0, 10))
+    assert counts.tolist() == np.histogram(narr, bins=2, range=(0, 10))[0].tolist()
+
+
+def test_take(img):
+    coords = np.array([[0, 0, 0], [1, 2, 3], [-1, 0, -2]])
+    expected = [img[tuple(int(x) for x in c)].get() for c in coords]
+    assert img.take(coords).tolist() == expected
+    assert img.take(coords).dtype == np.int8
+    # views are read via the bounding box of the pixels
+    view = img[:, 1:, :]
+    assert view.take([[1, 0, 3]]).tolist() == [img[1, 1, 3].get()]
+    with pytest.raises(IndexError):
+        img.take([[2, 0, 0]])
+
+
+def test_put(img):
+    coords = np.array([[0, 0, 0], [1, 2, 3]])
+    img.put(coords, [-5, 7])
+    assert img[0, 0, 0].get() == -5
+    assert img[1, 2, 3].get() == 7
+    # images wrapping NumPy memory are written in place
+    narr = np.zeros((4, 3, 2), dtype=np.uint16)
+    rai = imglyb.to_imglib(narr)
+    rai.put([[1, 2, 3], [0, 0, 0]], 9)
+    assert narr[3, 2, 1] == 9 and narr[0, 0, 0] == 9
+    assert narr.sum() == 18
+
+
+def test_take_and_put_sparse():
+    # NB: Far apart pixels are accessed one at a time, not via their bounding box.
+    ArrayImgs = sj.jimport("net.imglib2.img.array.ArrayImgs")
+    img = ArrayImgs.floats(1000, 1000)
+    coords = [[0, 0], [999, 999], [500, 3]]
+    img.put(coords, [1.5, 2.5, 3.5])
+    assert img.take(coords).tolist() == [1.5, 2.5, 3.5]
+    assert img[1, 1].get() == 0
+
+
+def test_take_far_apart_pixels():
+    # NB: The bounding box of these pixels has 2**88 pixels, overflowing int64.
+    ArrayImgs = sj.jimport("net.imglib2.img.array.ArrayImgs")
+    FloatType = sj.jimport("net.imglib2.type.numeric.real.FloatType")
+    Views = sj.jimport("net.imglib2.view.Views")
+    extended = Views.extendValue(ArrayImgs.floats(1, 1, 1, 1), FloatType(7))
+    last = 2**22 - 1
+    view = Views.interval(extended, JArray(JLong)([0] * 4), JArray(JLong)([last] * 4))
+    assert view.take([[0, 0, 0, 0], [last] * 4]).tolist() == [0, 7]
+
+
+def test_put_keeps_other_pixels(img):
+    before = _to_ndarray(img)
+    img.put([[0, 1, 1], [1, 2, 2]], 0)
+    before[0, 1, 1] = before[1, 2, 2] = 0
+    assert (_to_ndarray(img) == before).all()
+
+
+def test_boolean_mask_index(img):
+    narr = _to_ndarray(img)
+    mask = narr % 5 == 0
+    assert img[mask].tolist() == narr[mask].tolist()
+
+
+def test_integer_array_index(img):
+    narr = _to_ndarray(img)
+    actual = img[[1, 0], :, [3, 1]]
+    assert isinstance(actual, np.ndarray)
+    assert actual.tolist() == narr[[1, 0], :, [3, 1]].tolist()
+    assert img[[1]].tolist() == narr[[1]].tolist()
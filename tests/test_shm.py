@@ -0,0 +1,37 @@
+import pickle
+
+import numpy as np
+
+from imagej.shm import SharedArray
+
+# -- Tests --
+
+
+def test_shared_array_pickles_by_name():
+    narr = np.arange(12, dtype=np.uint16).reshape(3, 4)
+    with SharedArray.copy_of(narr) as shared:
+        attached = pickle.loads(pickle.dumps(shared))
+        assert attached.name == shared.name
+        assert np.array_equal(attached.array, narr)
+        # both share the same memory
+        attached.array[0, 0] = 99
+        assert shared.array[0, 0] == 99
+        attached.close()
+
+
+def test_shared_array_outlives_close():
+    with SharedArray.copy_of(np.arange(6.0)) as shared:
+        view = shared.array[1::2]
+        shared.close()
+        # views keep the block mapped until they are garbage collected
+        assert np.array_equal(view, [1.0, 3.0, 5.0])
+
+
+def test_shared_array_to_java(ij_fixture):
+    narr = np.zeros((4, 5), dtype=np.float32)
+    with SharedArray.copy_of(narr) as shared:
+        img = ij_fixture.py.to_java(shared)
+        assert list(img.shape) == [5, 4]
+        # the Java image wraps the shared memory without copying
+        img[2, 1].setReal(7)
+        assert shared.array[1, 2] == 7